@@ -4,32 +4,95 @@ import logging
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.future import select
 
-from app.core.cache import rate_limit_check
+from app.core.cache import (
+    get_cached_api_key,
+    rate_limit_check_windows,
+    record_api_key_usage,
+    set_cached_api_key,
+)
 from app.core.config import get_settings
-from app.core.database import get_db
-from app.models.api_key import ApiKey
+from app.core.database import get_db, get_db_session
+from app.crud.api_key import api_key_crud
+from app.models.api_key import ApiKey, ApiKeySnapshot
 
 logger = logging.getLogger(__name__)
 
 # Security scheme for API keys
 security = HTTPBearer(auto_error=False)
 
+# Settings are bound once at import instead of looked up on every request
+_settings = get_settings()
+
+# Lowercase header names matched against the raw ASGI headers
+_API_KEY_HEADER = _settings.API_KEY_HEADER.lower().encode("latin-1")
+_X_FORWARDED_FOR = b"x-forwarded-for"
+_X_REAL_IP = b"x-real-ip"
+
+
+def refresh_settings() -> None:
+    """Rebind the settings used by these dependencies, e.g. in tests."""
+    global _settings, _API_KEY_HEADER
+    _settings = get_settings()
+    _API_KEY_HEADER = _settings.API_KEY_HEADER.lower().encode("latin-1")
+
+
+def _get_header(request: Request, name: bytes) -> str | None:
+    """
+    Get a header value by its lowercase name.
+
+    Scans the raw ASGI headers directly rather than building Starlette's
+    case-insensitive Headers mapping.
+    """
+    for key, value in request.scope["headers"]:
+        if key == name:
+            return value.decode("latin-1")
+    return None
+
+
+async def lookup_api_key(db: AsyncSession | None, api_key: str) -> ApiKeySnapshot | None:
+    """
+    Resolve a raw API key to a snapshot, consulting the Redis cache first.
+
+    Only falls back to the database on a cache miss; found keys are cached
+    for API_KEY_CACHE_TTL seconds. If no session is given, one is opened
+    only when the database is actually needed.
+
+    Because nothing invalidates the cache, deactivating a key, changing its
+    expiry or its rate limits takes effect within API_KEY_CACHE_TTL seconds,
+    not immediately.
+    """
+    # Hash the provided key to compare with stored hash
+    key_hash = ApiKey.hash_key(api_key)
+
+    cached = await get_cached_api_key(key_hash)
+    if cached is not None:
+        return ApiKeySnapshot.from_dict(cached)
+
+    if db is None:
+        async with get_db_session() as session:
+            snapshot = await api_key_crud.get_snapshot_by_hash(session, key_hash)
+    else:
+        snapshot = await api_key_crud.get_snapshot_by_hash(db, key_hash)
+    if not snapshot:
+        return None
+
+    await set_cached_api_key(key_hash, snapshot.to_dict())
+    return snapshot
+
 
 async def get_current_api_key(
     request: Request,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security)
-) -> ApiKey | None:
+) -> ApiKeySnapshot | None:
     """
     Get and validate API key from request headers.
 
     Returns None if API keys are not required or if no key is provided.
     Raises HTTPException for invalid keys.
     """
-    settings = get_settings()
-    if not settings.API_KEY_REQUIRED:
+    if not _settings.API_KEY_REQUIRED:
         return None
 
     # Try to get API key from Authorization header first
@@ -38,7 +101,7 @@ async def get_current_api_key(
         api_key = credentials.credentials
     else:
         # Try custom header
-        api_key = request.headers.get(settings.API_KEY_HEADER)
+        api_key = _get_header(request, _API_KEY_HEADER)
 
     if not api_key:
         raise HTTPException(
@@ -47,14 +110,7 @@ async def get_current_api_key(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Hash the provided key to compare with stored hash
-    key_hash = ApiKey.hash_key(api_key)
-
-    # Query database for API key
-    result = await db.execute(
-        select(ApiKey).where(ApiKey.key_hash == key_hash)
-    )
-    api_key_obj = result.scalar_one_or_none()
+    api_key_obj = await lookup_api_key(db, api_key)
 
     if not api_key_obj:
         raise HTTPException(
@@ -69,9 +125,8 @@ async def get_current_api_key(
             detail=detail,
         )
 
-    # Update usage statistics
-    api_key_obj.update_last_used()
-    await db.commit()
+    # Buffer usage statistics; flushed to the database in the background
+    await record_api_key_usage(str(api_key_obj.id))
 
     return api_key_obj
 
@@ -80,34 +135,30 @@ async def get_api_key_when_required(
     request: Request,
     db: AsyncSession = Depends(get_db),
     credentials: HTTPAuthorizationCredentials | None = Depends(security)
-) -> ApiKey | None:
+) -> ApiKeySnapshot | None:
     """
     Get API key based on API_KEY_REQUIRED setting.
     
     - If API_KEY_REQUIRED=True: Requires valid API key (raises 401 if invalid/missing)
     - If API_KEY_REQUIRED=False: Optional API key (returns None if not provided)
     """
-    settings = get_settings()
-    
-    if settings.API_KEY_REQUIRED:
+    if _settings.API_KEY_REQUIRED:
         # Use strict authentication
         return await get_current_api_key(request, db, credentials)
     else:
         # Use optional authentication
-        return await get_optional_api_key(request, db)
+        return await get_optional_api_key(request)
 
 
 async def check_rate_limit(
     request: Request,
-    api_key: ApiKey | None = Depends(get_current_api_key)
+    api_key: ApiKeySnapshot | None = Depends(get_current_api_key)
 ) -> None:
     """
     Check rate limits for the current request.
 
     Raises HTTPException if rate limit is exceeded.
     """
-    settings = get_settings()
-
     try:
         # Determine rate limits and identifier
         if api_key:
@@ -117,48 +168,30 @@ async def check_rate_limit(
             key_identifier = f"api_key:{api_key.id}"
         else:
             # Use global/IP-based limits
-            minute_limit = settings.RATE_LIMIT_PER_MINUTE
-            hour_limit = settings.RATE_LIMIT_PER_HOUR
+            minute_limit = _settings.RATE_LIMIT_PER_MINUTE
+            hour_limit = _settings.RATE_LIMIT_PER_HOUR
             client_ip = request.client.host if request.client else "unknown"
             key_identifier = f"ip:{client_ip}"
 
-        # Check per-minute rate limit
-        minute_result = await rate_limit_check(
-            f"{key_identifier}:minute",
-            minute_limit,
-            60  # 1 minute window
+        # Check per-minute and per-hour limits in one atomic round-trip
+        minute_result, hour_result = await rate_limit_check_windows(
+            key_identifier,
+            [("minute", minute_limit, 60), ("hour", hour_limit, 3600)],
         )
 
-        if not minute_result.get("allowed", True):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded - too many requests per minute",
-                headers={
-                    "X-RateLimit-Limit": str(minute_limit),
-                    "X-RateLimit-Remaining": str(max(0, minute_limit - minute_result.get("current_count", 0))),
-                    "X-RateLimit-Reset": minute_result.get("reset_time", ""),
-                    "Retry-After": "60"
-                }
-            )
-
-        # Check per-hour rate limit
-        hour_result = await rate_limit_check(
-            f"{key_identifier}:hour",
-            hour_limit,
-            3600  # 1 hour window
-        )
-
-        if not hour_result.get("allowed", True):
-            raise HTTPException(
-                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
-                detail="Rate limit exceeded - too many requests per hour",
-                headers={
-                    "X-RateLimit-Limit": str(hour_limit),
-                    "X-RateLimit-Remaining": str(max(0, hour_limit - hour_result.get("current_count", 0))),
-                    "X-RateLimit-Reset": hour_result.get("reset_time", ""),
-                    "Retry-After": "3600"
-                }
-            )
+        for result, period in ((minute_result, "minute"), (hour_result, "hour")):
+            if not result.get("allowed", True):
+                limit = result["limit"]
+                raise HTTPException(
+                    status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                    detail=f"Rate limit exceeded - too many requests per {period}",
+                    headers={
+                        "X-RateLimit-Limit": str(limit),
+                        "X-RateLimit-Remaining": str(max(0, limit - result.get("current_count", 0))),
+                        "X-RateLimit-Reset": result.get("reset_time", ""),
+                        "Retry-After": str(result.get("reset_seconds", result["window_seconds"])),
+                    }
+                )
 
         logger.debug(
             f"Rate limit check passed for {key_identifier}: "
@@ -173,27 +206,21 @@ async def check_rate_limit(
         # Allow request to proceed in case of rate limit check failure
 
 
-async def get_optional_api_key(
-    request: Request,
-    db: AsyncSession = Depends(get_db)
-) -> ApiKey | None:
+async def get_optional_api_key(request: Request) -> ApiKeySnapshot | None:
     """
     Get API key if provided, but don't require it.
     Used for endpoints that work both with and without authentication.
+
+    Does not depend on a database session, so requests without a key
+    never open one.
     """
-    settings = get_settings()
-    if not settings.API_KEY_REQUIRED:
+    if not _settings.API_KEY_REQUIRED:
         # Still try to get the key if provided for tracking purposes
-        api_key = request.headers.get(settings.API_KEY_HEADER)
+        api_key = _get_header(request, _API_KEY_HEADER)
         if api_key:
-            key_hash = ApiKey.hash_key(api_key)
-            result = await db.execute(
-                select(ApiKey).where(ApiKey.key_hash == key_hash)
-            )
-            api_key_obj = result.scalar_one_or_none()
+            api_key_obj = await lookup_api_key(None, api_key)
             if api_key_obj and api_key_obj.is_valid:
-                api_key_obj.update_last_used()
-                await db.commit()
+                await record_api_key_usage(str(api_key_obj.id))
                 return api_key_obj
 
     return None
@@ -205,12 +232,12 @@ def get_client_ip(request: Request) -> str:
 
     Handles X-Forwarded-For, X-Real-IP headers for reverse proxy setups.
     """
-    forwarded_for = request.headers.get("X-Forwarded-For")
+    forwarded_for = _get_header(request, _X_FORWARDED_FOR)
     if forwarded_for:
         # Get first IP if multiple are present
         return forwarded_for.split(",")[0].strip()
 
-    real_ip = request.headers.get("X-Real-IP")
+    real_ip = _get_header(request, _X_REAL_IP)
     if real_ip:
         return real_ip
 
@@ -218,10 +245,15 @@ def get_client_ip(request: Request) -> str:
     return request.client.host if request.client else "unknown"
 
 
+_SORT_ORDERS = frozenset({"asc", "desc"})
+
+
 class CommonQueryParams:
     """
     Common query parameters for pagination.
     """
+    __slots__ = ("limit", "offset", "order", "page", "per_page", "sort")
+
     def __init__(
         self,
         page: int = 1,
@@ -232,12 +264,7 @@ class CommonQueryParams:
         self.page = max(1, page)
         self.per_page = min(100, max(1, per_page))  # Limit to 100 items per page
         self.sort = sort
-        self.order = order.lower() if order.lower() in ["asc", "desc"] else "desc"
-
-    @property
-    def offset(self) -> int:
-        return (self.page - 1) * self.per_page
-
-    @property
-    def limit(self) -> int:
-        return self.per_page
+        order = order.lower()
+        self.order = order if order in _SORT_ORDERS else "desc"
+        self.offset = (self.page - 1) * self.per_page
+        self.limit = self.per_page
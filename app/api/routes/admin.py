@@ -1,27 +1,62 @@
 """Admin API routes for system management."""
 import logging
-from datetime import datetime
 
-import psutil
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import get_optional_api_key
+from app.core.clock import utcnow_iso
 from app.core.database import get_db
+from app.core.local_cache import cached
 from app.core.redis import RedisQueue, get_redis
 from app.crud.job import job_crud
-from app.models.api_key import ApiKey
+from app.models.api_key import ApiKeySnapshot
 from app.schemas.scraping import (
     AdminStatsResponse,
     JobStatsResponse,
     QueueStatsResponse,
 )
+from app.services.job_stats import load_job_stats
+from app.services.system_metrics import (
+    get_cpu_percent,
+    get_disk_usage,
+    get_virtual_memory,
+)
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
 
+# Prometheus-style metrics templates, rendered with one format() call each
+_METRICS_TEMPLATE = (
+    "scraper_jobs_total {total}\n"
+    "scraper_jobs_pending {pending}\n"
+    "scraper_jobs_running {running}\n"
+    "scraper_jobs_completed {completed}\n"
+    "scraper_jobs_failed {failed}\n"
+    "scraper_jobs_cancelled {cancelled}\n"
+    "scraper_jobs_retrying {retrying}\n"
+    "scraper_jobs_avg_execution_time {average_execution_time}\n"
+    "scraper_queue_pending {queue_pending}\n"
+    "scraper_queue_processing {queue_processing}\n"
+    "scraper_queue_total {queue_total}"
+)
+
+_SYSTEM_METRICS_TEMPLATE = (
+    "\nscraper_system_cpu_percent {cpu_percent}\n"
+    "scraper_system_memory_percent {memory.percent}\n"
+    "scraper_system_memory_used {memory.used}\n"
+    "scraper_system_memory_available {memory.available}"
+)
+
+
+@cached(ttl=10)
+async def _get_redis_memory_info(redis_client) -> dict:
+    """Get Redis INFO memory, shared between callers for a few seconds."""
+    return await redis_client.info("memory")
+
+
 @router.get(
     "/admin/stats",
     response_model=AdminStatsResponse,
@@ -30,7 +65,7 @@ router = APIRouter()
 )
 async def get_admin_stats(
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
 ) -> AdminStatsResponse:
     """
     Get comprehensive system statistics.
@@ -40,7 +75,7 @@ async def get_admin_stats(
     try:
         # Get job statistics
         api_key_id = api_key.id if api_key else None
-        job_stats_data = await job_crud.get_job_stats(db, api_key_id=api_key_id)
+        job_stats_data = await load_job_stats(db, api_key_id=api_key_id)
 
         job_stats = JobStatsResponse(
             total=job_stats_data["total"],
@@ -68,7 +103,7 @@ async def get_admin_stats(
         # Get cache statistics
         cache_stats = {}
         try:
-            cache_info = await redis_client.info("memory")
+            cache_info = await _get_redis_memory_info(redis_client)
             cache_stats = {
                 "used_memory": cache_info.get("used_memory", 0),
                 "used_memory_human": cache_info.get("used_memory_human", "0B"),
@@ -83,13 +118,13 @@ async def get_admin_stats(
         system_stats = {}
         try:
             # CPU usage
-            cpu_percent = psutil.cpu_percent(interval=1)
+            cpu_percent = get_cpu_percent()
 
             # Memory usage
-            memory = psutil.virtual_memory()
+            memory = get_virtual_memory()
 
             # Disk usage
-            disk = psutil.disk_usage("/")
+            disk = get_disk_usage("/")
 
             system_stats = {
                 "cpu_percent": cpu_percent,
@@ -99,7 +134,7 @@ async def get_admin_stats(
                 "disk_total": disk.total,
                 "disk_free": disk.free,
                 "disk_percent": (disk.total - disk.free) / disk.total * 100,
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": utcnow_iso(),
             }
         except Exception as e:
             logger.warning(f"Could not get system stats: {e}")
@@ -129,7 +164,7 @@ async def cleanup_old_jobs(
     older_than_days: int = 30,
     keep_failed: bool = True,
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
 ) -> dict:
     """
     Clean up old jobs from the database.
@@ -160,7 +195,7 @@ async def cleanup_old_jobs(
             "deleted_count": deleted_count,
             "older_than_days": older_than_days,
             "kept_failed": keep_failed,
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utcnow_iso()
         }
 
     except HTTPException:
@@ -180,7 +215,7 @@ async def cleanup_old_jobs(
 )
 async def get_metrics(
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
 ) -> str:
     """
     Get metrics in Prometheus format.
@@ -191,7 +226,7 @@ async def get_metrics(
     try:
         # Get job statistics
         api_key_id = api_key.id if api_key else None
-        stats = await job_crud.get_job_stats(db, api_key_id=api_key_id)
+        stats = await load_job_stats(db, api_key_id=api_key_id)
 
         # Get queue statistics
         redis_client = await get_redis()
@@ -199,36 +234,24 @@ async def get_metrics(
         queue_stats = await queue.get_queue_stats()
 
         # Generate Prometheus-style metrics
-        metrics = []
-
-        # Job metrics
-        metrics.append(f"scraper_jobs_total {stats['total']}")
-        metrics.append(f"scraper_jobs_pending {stats['pending']}")
-        metrics.append(f"scraper_jobs_running {stats['running']}")
-        metrics.append(f"scraper_jobs_completed {stats['completed']}")
-        metrics.append(f"scraper_jobs_failed {stats['failed']}")
-        metrics.append(f"scraper_jobs_cancelled {stats['cancelled']}")
-        metrics.append(f"scraper_jobs_retrying {stats['retrying']}")
-        metrics.append(f"scraper_jobs_avg_execution_time {stats['average_execution_time']}")
-
-        # Queue metrics
-        metrics.append(f"scraper_queue_pending {queue_stats['pending']}")
-        metrics.append(f"scraper_queue_processing {queue_stats['processing']}")
-        metrics.append(f"scraper_queue_total {queue_stats['total']}")
+        metrics = _METRICS_TEMPLATE.format(
+            **stats,
+            queue_pending=queue_stats["pending"],
+            queue_processing=queue_stats["processing"],
+            queue_total=queue_stats["total"],
+        )
 
         # System metrics (if available)
         try:
-            cpu_percent = psutil.cpu_percent()
-            memory = psutil.virtual_memory()
-
-            metrics.append(f"scraper_system_cpu_percent {cpu_percent}")
-            metrics.append(f"scraper_system_memory_percent {memory.percent}")
-            metrics.append(f"scraper_system_memory_used {memory.used}")
-            metrics.append(f"scraper_system_memory_available {memory.available}")
+            memory = get_virtual_memory()
+            metrics += _SYSTEM_METRICS_TEMPLATE.format(
+                cpu_percent=get_cpu_percent(),
+                memory=memory,
+            )
         except Exception:
             pass  # Skip system metrics if not available
 
-        return "\n".join(metrics)
+        return metrics
 
     except Exception as e:
         logger.error(f"Error generating metrics: {e}")
@@ -244,6 +267,7 @@ async def get_metrics(
     summary="Get queue status",
     description="Get detailed queue statistics"
 )
+@cached(ttl=5)
 async def get_queue_status() -> QueueStatsResponse:
     """
     Get detailed queue statistics.
@@ -4,12 +4,15 @@ import logging
 import time
 from datetime import datetime
 
-from fastapi import APIRouter, Depends, HTTPException, status
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Response, status
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.clock import utcnow_iso
 from app.core.config import settings
 from app.core.database import get_db
+from app.core.local_cache import cached
 from app.core.redis import get_redis
 from app.schemas.scraping import HealthResponse
 
@@ -20,6 +23,42 @@ router = APIRouter()
 # Track application start time for uptime calculation
 start_time = time.time()
 
+# Version information is static for the lifetime of the process
+VERSION_INFO = {
+    "version": settings.PROJECT_VERSION,
+    "name": settings.PROJECT_NAME,
+    "api_version": settings.API_V1_STR,
+}
+
+# Preserialized body for the liveness probe, bypassing response model serialization
+_LIVE_BODY = b'{"status":"alive"}'
+
+
+async def _check_db(db: AsyncSession, timeout: float) -> None:
+    """Run a trivial query against the database, raising on failure."""
+    await asyncio.wait_for(db.execute(text("SELECT 1")), timeout=timeout)
+
+
+async def _check_redis(timeout: float) -> None:
+    """Ping Redis, raising on failure."""
+    redis_client = await get_redis()
+    await asyncio.wait_for(redis_client.ping(), timeout=timeout)
+
+
+async def _run_checks(db: AsyncSession, timeout: float) -> dict[str, BaseException | None]:
+    """
+    Run database and Redis checks concurrently.
+
+    Returns a dict mapping component name to the exception it raised,
+    or None if the check passed.
+    """
+    db_result, redis_result = await asyncio.gather(
+        _check_db(db, timeout),
+        _check_redis(timeout),
+        return_exceptions=True,
+    )
+    return {"database": db_result, "redis": redis_result}
+
 
 @router.get(
     "/health",
@@ -38,32 +77,13 @@ async def health_check(
     checks = {}
     overall_status = "healthy"
 
-    # Check database connection
-    try:
-        await asyncio.wait_for(
-            db.execute(text("SELECT 1")),
-            timeout=settings.HEALTH_CHECK_TIMEOUT
-        )
-        checks["database"] = True
-        logger.debug("Database health check passed")
-    except Exception as e:
-        checks["database"] = False
-        overall_status = "unhealthy"
-        logger.error(f"Database health check failed: {e}")
-
-    # Check Redis connection
-    try:
-        redis_client = await get_redis()
-        await asyncio.wait_for(
-            redis_client.ping(),
-            timeout=settings.HEALTH_CHECK_TIMEOUT
-        )
-        checks["redis"] = True
-        logger.debug("Redis health check passed")
-    except Exception as e:
-        checks["redis"] = False
-        overall_status = "unhealthy"
-        logger.error(f"Redis health check failed: {e}")
+    for component, error in (await _run_checks(db, settings.HEALTH_CHECK_TIMEOUT)).items():
+        checks[component] = error is None
+        if error is None:
+            logger.debug(f"{component.capitalize()} health check passed")
+        else:
+            overall_status = "unhealthy"
+            logger.error(f"{component.capitalize()} health check failed: {error}")
 
     # Calculate uptime
     uptime = time.time() - start_time
@@ -91,42 +111,31 @@ async def readiness_check(
     Returns 200 if the service is ready to handle requests,
     503 if not ready.
     """
-    try:
-        # Quick database check
-        await asyncio.wait_for(
-            db.execute(text("SELECT 1")),
-            timeout=2  # Shorter timeout for readiness
-        )
-
-        # Quick Redis check
-        redis_client = await get_redis()
-        await asyncio.wait_for(
-            redis_client.ping(),
-            timeout=2
-        )
-
-        return {"status": "ready"}
-
-    except Exception as e:
-        logger.error(f"Readiness check failed: {e}")
+    # Quick database and Redis checks (shorter timeout for readiness)
+    results = await _run_checks(db, timeout=2)
+    errors = [error for error in results.values() if error is not None]
+    if errors:
+        logger.error(f"Readiness check failed: {errors[0]}")
         raise HTTPException(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail="Service not ready"
         )
 
+    return {"status": "ready"}
+
 
 @router.get(
     "/health/live",
     summary="Liveness check",
     description="Check if the service is alive"
 )
-async def liveness_check() -> dict:
+async def liveness_check() -> Response:
     """
     Kubernetes-style liveness probe.
 
     Returns 200 if the service is alive.
     """
-    return {"status": "alive"}
+    return Response(content=_LIVE_BODY, media_type="application/json")
 
 
 @router.get(
@@ -134,16 +143,12 @@ async def liveness_check() -> dict:
     summary="Get API version",
     description="Get the current API version information"
 )
-async def get_version() -> dict:
+async def get_version() -> Response:
     """
     Get API version and build information.
     """
-    return {
-        "version": settings.PROJECT_VERSION,
-        "name": settings.PROJECT_NAME,
-        "api_version": settings.API_V1_STR,
-        "uptime": time.time() - start_time
-    }
+    body = orjson.dumps({**VERSION_INFO, "uptime": time.time() - start_time})
+    return Response(content=body, media_type="application/json")
 
 
 @router.get(
@@ -151,6 +156,7 @@ async def get_version() -> dict:
     summary="Get application metrics",
     description="Get basic application metrics for monitoring"
 )
+@cached(ttl=10)
 async def get_metrics(
     db: AsyncSession = Depends(get_db)
 ) -> dict:
@@ -164,31 +170,15 @@ async def get_metrics(
         uptime = time.time() - start_time
         
         # Check service health
-        db_healthy = True
-        redis_healthy = True
-        
-        try:
-            await asyncio.wait_for(
-                db.execute(text("SELECT 1")),
-                timeout=2
-            )
-        except Exception:
-            db_healthy = False
-        
-        try:
-            redis_client = await get_redis()
-            await asyncio.wait_for(
-                redis_client.ping(),
-                timeout=2
-            )
-        except Exception:
-            redis_healthy = False
+        results = await _run_checks(db, timeout=2)
+        db_healthy = results["database"] is None
+        redis_healthy = results["redis"] is None
         
         return {
             "status": "healthy" if (db_healthy and redis_healthy) else "unhealthy",
             "uptime_seconds": uptime,
             "version": settings.PROJECT_VERSION,
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": utcnow_iso(),
             "components": {
                 "database": "healthy" if db_healthy else "unhealthy",
                 "redis": "healthy" if redis_healthy else "unhealthy"
@@ -203,5 +193,5 @@ async def get_metrics(
         return {
             "status": "error",
             "error": str(e),
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": utcnow_iso()
         }
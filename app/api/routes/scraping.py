@@ -1,10 +1,20 @@
 """Scraping API route handlers."""
+import asyncio
 import logging
 import math
 from datetime import datetime, timedelta
 from uuid import UUID
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Depends,
+    HTTPException,
+    Request,
+    Response,
+    status,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.dependencies import (
@@ -13,24 +23,192 @@ from app.api.dependencies import (
     get_api_key_when_required,
     get_optional_api_key,
 )
+from app.core.cache import (
+    generate_url_cache_key,
+    get_cached_job_response,
+    set_cached_job_response,
+)
+from app.core.config import get_settings
 from app.core.database import get_db
 from app.core.redis import RedisQueue, get_redis
 from app.crud.job import job_crud
-from app.models.api_key import ApiKey
+from app.models.api_key import ApiKeySnapshot
 from app.models.job import JobStatus
 from app.schemas.scraping import (
+    BatchScrapeRequest,
+    BatchScrapeResponse,
     JobDetailResponse,
     JobListResponse,
     JobStatsResponse,
     ScrapeRequest,
     ScrapeResponse,
 )
+from app.services.job_stats import load_job_stats
 from app.services.scraper import create_scraping_metadata, create_scraping_result
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_settings = get_settings()
+
+# Assumed job execution time until workers have reported one
+_DEFAULT_EXECUTION_TIME = 30.0
+
+# Single-job submissions in flight, keyed by API key, URL cache key, priority
+# and metadata
+_inflight_submissions: dict[tuple, asyncio.Future] = {}
+
+# Status filter values accepted by the job list endpoint
+_STATUS_FILTERS = {job_status.value: job_status for job_status in JobStatus}
+
+# Finished jobs never change again, so their details can be cached
+_FINISHED_STATUSES = frozenset({JobStatus.COMPLETED, JobStatus.FAILED})
+
+
+def _job_etag(job) -> str:
+    """Build a weak ETag from the job id, status and completion time."""
+    completed = int(job.completed_at.timestamp()) if job.completed_at else 0
+    return f'W/"{job.id.hex}:{job.status.value}:{completed}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check whether the request's If-None-Match header matches ``etag``."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return any(tag.strip() in (etag, "*") for tag in if_none_match.split(","))
+
+
+def _finished_job_response(request: Request, etag: str, body: str) -> Response:
+    """Build a 304 or JSON response for a finished job."""
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"private, max-age={_settings.JOB_RESPONSE_CACHE_TTL}",
+    }
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _submit_jobs(
+    db: AsyncSession,
+    requests: list[ScrapeRequest],
+    api_key: ApiKeySnapshot | None,
+) -> list[ScrapeResponse]:
+    """
+    Create jobs in the database and queue them for processing.
+
+    Uses one INSERT for all jobs and one ZADD to enqueue them.
+    """
+    api_key_id = api_key.id if api_key else None
+
+    # Create jobs in database
+    jobs = await job_crud.bulk_create(
+        db,
+        [
+            {
+                "url": str(request.url),
+                "selector": request.selector,
+                "options": request.options.dict() if request.options else {},
+                "priority": request.priority,
+                "scheduled_at": request.scheduled_at,
+                "api_key_id": api_key_id,
+                "metadata": request.metadata or {},
+            }
+            for request in requests
+        ],
+    )
+
+    # Add jobs to Redis queue
+    redis_client = await get_redis()
+    queue = RedisQueue(redis_client)
+
+    added, queue_size, avg_execution_time = await queue.enqueue_many_with_stats(
+        [(str(job.id), job.priority) for job in jobs]
+    )
+    if not added:
+        logger.error(f"Failed to enqueue jobs {[str(job.id) for job in jobs]}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to queue job for processing"
+        )
+
+    # Queued jobs drain WORKER_CONCURRENCY at a time at the average job duration
+    avg_execution_time = avg_execution_time or _DEFAULT_EXECUTION_TIME
+    expected_wait = timedelta(
+        seconds=max(avg_execution_time, avg_execution_time * queue_size / max(1, _settings.WORKER_CONCURRENCY))
+    )
+
+    responses = []
+    for request, job in zip(requests, jobs, strict=True):
+        # Estimate completion time (rough calculation)
+        estimated_completion = request.scheduled_at or datetime.utcnow() + expected_wait
+
+        logger.info(f"Job {job.id} created and queued successfully")
+
+        responses.append(ScrapeResponse(
+            job_id=job.id,
+            status=job.status.value,
+            url=job.url,
+            created_at=job.created_at,
+            estimated_completion=estimated_completion,
+            priority=job.priority,
+        ))
+
+    return responses
+
+
+async def _submit_job_once(
+    db: AsyncSession,
+    request: ScrapeRequest,
+    api_key: ApiKeySnapshot | None,
+) -> ScrapeResponse:
+    """
+    Submit a single job, coalescing identical concurrent submissions.
+
+    While a submission for the same URL, selector, options, priority and
+    metadata is in flight for the same API key, later callers wait for it and
+    get its job instead of creating a duplicate. Scheduled jobs are always
+    created separately.
+    """
+    if request.scheduled_at is not None:
+        return (await _submit_jobs(db, [request], api_key))[0]
+
+    options = request.options.dict() if request.options else {}
+    key = (
+        api_key.id if api_key else None,
+        generate_url_cache_key(str(request.url), request.selector, options),
+        request.priority,
+        orjson.dumps(request.metadata, option=orjson.OPT_SORT_KEYS),
+    )
+    inflight = _inflight_submissions.get(key)
+    if inflight is not None:
+        try:
+            return await asyncio.shield(inflight)
+        except asyncio.CancelledError:
+            # Only the first caller was cancelled, not this one: submit anew,
+            # coalescing with any other callers that were waiting on it
+            if not inflight.cancelled() or asyncio.current_task().cancelling():
+                raise
+            return await _submit_job_once(db, request, api_key)
+
+    future = asyncio.get_running_loop().create_future()
+    _inflight_submissions[key] = future
+    try:
+        response = (await _submit_jobs(db, [request], api_key))[0]
+        future.set_result(response)
+        return response
+    except Exception as e:
+        future.set_exception(e)
+        # Mark the exception as retrieved in case nobody else is waiting
+        future.exception()
+        raise
+    finally:
+        del _inflight_submissions[key]
+        if not future.done():
+            future.cancel()
+
 
 @router.post(
     "/scrape",
@@ -43,7 +221,7 @@ async def submit_scrape_job(
     request: ScrapeRequest,
     background_tasks: BackgroundTasks,
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_api_key_when_required),
+    api_key: ApiKeySnapshot | None = Depends(get_api_key_when_required),
     _rate_limit: None = Depends(check_rate_limit),
 ) -> ScrapeResponse:
     """
@@ -53,57 +231,48 @@ async def submit_scrape_job(
     with a job ID that can be used to check status and retrieve results.
     """
     try:
-        # Create job in database
-        job = await job_crud.create(
-            db,
-            url=str(request.url),
-            selector=request.selector,
-            options=request.options.dict() if request.options else {},
-            priority=request.priority,
-            scheduled_at=request.scheduled_at,
-            api_key_id=api_key.id if api_key else None,
-            metadata=request.metadata or {},
-        )
-
-        # Add job to Redis queue
-        redis_client = await get_redis()
-        queue = RedisQueue(redis_client)
+        return await _submit_job_once(db, request, api_key)
 
-        success = await queue.enqueue(str(job.id), priority=request.priority)
-        if not success:
-            logger.error(f"Failed to enqueue job {job.id}")
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Failed to queue job for processing"
-            )
+    except Exception as e:
+        logger.error(f"Error creating scrape job: {e}")
+        if isinstance(e, HTTPException):
+            raise
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Failed to create scraping job"
+        )
 
-        # Estimate completion time (rough calculation)
-        estimated_completion = None
-        if request.scheduled_at:
-            estimated_completion = request.scheduled_at
-        else:
-            # Simple estimation: current time + average processing time
-            # This would be more sophisticated in production
-            estimated_completion = datetime.utcnow() + timedelta(seconds=30)
 
-        logger.info(f"Job {job.id} created and queued successfully")
+@router.post(
+    "/scrape/batch",
+    response_model=BatchScrapeResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="Submit scraping jobs in bulk",
+    description="Submit up to 100 web scraping jobs in one request. Requires API key when API_KEY_REQUIRED=true."
+)
+async def submit_scrape_jobs_batch(
+    request: BatchScrapeRequest,
+    db: AsyncSession = Depends(get_db),
+    api_key: ApiKeySnapshot | None = Depends(get_api_key_when_required),
+    _rate_limit: None = Depends(check_rate_limit),
+) -> BatchScrapeResponse:
+    """
+    Submit several scraping jobs at once.
 
-        return ScrapeResponse(
-            job_id=job.id,
-            status=job.status.value,
-            url=job.url,
-            created_at=job.created_at,
-            estimated_completion=estimated_completion,
-            priority=job.priority,
-        )
+    All jobs are created in a single database round-trip and queued with
+    a single Redis command.
+    """
+    try:
+        responses = await _submit_jobs(db, request.jobs, api_key)
+        return BatchScrapeResponse(jobs=responses)
 
     except Exception as e:
-        logger.error(f"Error creating scrape job: {e}")
+        logger.error(f"Error creating batch scrape jobs: {e}")
         if isinstance(e, HTTPException):
             raise
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to create scraping job"
+            detail="Failed to create scraping jobs"
         )
 
 
@@ -115,14 +284,27 @@ async def submit_scrape_job(
 )
 async def get_job_details(
     job_id: UUID,
+    request: Request,
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
-) -> JobDetailResponse:
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
+) -> JobDetailResponse | Response:
     """
     Get detailed job information including results if available.
+
+    Finished jobs are served from a Redis cache with a weak ETag, and
+    requests whose If-None-Match matches get an empty 304 response.
     """
     try:
-        job = await job_crud.get(db, job_id)
+        cached = await get_cached_job_response(str(job_id))
+        if cached:
+            if api_key and cached["api_key_id"] != str(api_key.id):
+                raise HTTPException(
+                    status_code=status.HTTP_403_FORBIDDEN,
+                    detail="Access denied to this job"
+                )
+            return _finished_job_response(request, cached["etag"], cached["body"])
+
+        job = await job_crud.get_with_result(db, job_id)
         if not job:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -145,7 +327,7 @@ async def get_job_details(
             scraped_data = create_scraping_result(job.result.data)
             metadata = create_scraping_metadata(job.result.result_metadata or {}, job)
 
-        return JobDetailResponse(
+        response = JobDetailResponse(
             job_id=job.id,
             status=job.status.value,
             url=job.url,
@@ -162,6 +344,15 @@ async def get_job_details(
             metadata=metadata,
         )
 
+        if job.status not in _FINISHED_STATUSES:
+            return response
+
+        etag = _job_etag(job)
+        body = response.model_dump_json()
+        api_key_id = str(job.api_key_id) if job.api_key_id else None
+        await set_cached_job_response(str(job_id), etag, api_key_id, body)
+        return _finished_job_response(request, etag, body)
+
     except HTTPException:
         raise
     except Exception as e:
@@ -181,7 +372,7 @@ async def get_job_details(
 async def list_recent_jobs(
     params: CommonQueryParams = Depends(),
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
     status_filter: str | None = None,
 ) -> JobListResponse:
     """
@@ -193,24 +384,26 @@ async def list_recent_jobs(
 
         if status_filter:
             # Validate status filter
-            try:
-                status_enum = JobStatus(status_filter.lower())
-                jobs = await job_crud.get_by_status(
-                    db,
-                    status=status_enum,
-                    limit=params.limit,
-                    offset=params.offset
-                )
-            except ValueError:
+            status_enum = _STATUS_FILTERS.get(status_filter)
+            if status_enum is None:
+                status_enum = _STATUS_FILTERS.get(status_filter.lower())
+            if status_enum is None:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Invalid status filter: {status_filter}"
                 )
+            jobs, total = await job_crud.get_page(
+                db,
+                limit=params.limit,
+                offset=params.offset,
+                status=status_enum,
+            )
         else:
-            jobs = await job_crud.get_recent_jobs(
+            jobs, total = await job_crud.get_page(
                 db,
                 limit=params.limit,
-                api_key_id=api_key_id
+                offset=params.offset,
+                api_key_id=api_key_id,
             )
 
         # Convert to response format
@@ -240,9 +433,6 @@ async def list_recent_jobs(
                 metadata=metadata,
             ))
 
-        # Get total count for pagination
-        # In a real implementation, you'd want a separate count query
-        total = len(job_responses)  # Simplified
         pages = math.ceil(total / params.per_page) if params.per_page > 0 else 1
 
         return JobListResponse(
@@ -271,14 +461,14 @@ async def list_recent_jobs(
 )
 async def get_job_stats(
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
 ) -> JobStatsResponse:
     """
     Get job statistics.
     """
     try:
         api_key_id = api_key.id if api_key else None
-        stats = await job_crud.get_job_stats(db, api_key_id=api_key_id)
+        stats = await load_job_stats(db, api_key_id=api_key_id)
 
         return JobStatsResponse(
             total=stats["total"],
@@ -308,7 +498,7 @@ async def get_job_stats(
 async def cancel_job(
     job_id: UUID,
     db: AsyncSession = Depends(get_db),
-    api_key: ApiKey | None = Depends(get_optional_api_key),
+    api_key: ApiKeySnapshot | None = Depends(get_optional_api_key),
 ) -> None:
     """
     Cancel a scraping job.
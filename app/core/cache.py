@@ -6,32 +6,52 @@ for caching, rate limiting, job queue management, and job status tracking.
 """
 
 import hashlib
-import json
 import logging
-from datetime import datetime, timedelta
+from datetime import UTC, date, datetime, timedelta
 from typing import Any
+from uuid import UUID
 
+import msgpack
+import orjson
 import redis.asyncio as redis
-from redis.asyncio import ConnectionPool
+from redis.asyncio import BlockingConnectionPool, ConnectionPool
+from redis.utils import HIREDIS_AVAILABLE
 
 from .config import get_settings
+from .local_cache import TTLCache
 
 logger = logging.getLogger(__name__)
 
+# TTLs used on every cache write; they do not change at runtime
+_settings = get_settings()
+
+# In-process layer in front of Redis for hot scrape results
+_local_scrape_cache = TTLCache(ttl=60, maxsize=1024)
+
 # Global Redis client and connection pool
 _redis_client: redis.Redis | None = None
 _connection_pool: ConnectionPool | None = None
 
 
 def create_redis_pool() -> ConnectionPool:
-    """Create Redis connection pool with configuration."""
+    """
+    Create Redis connection pool with configuration.
+
+    Replies are returned as raw bytes; cached JSON goes straight to orjson
+    without an intermediate UTF-8 decode.
+    """
     settings = get_settings()
 
-    return ConnectionPool.from_url(
+    # redis-py picks the C parser automatically when hiredis is importable
+    if not HIREDIS_AVAILABLE:
+        logger.warning("hiredis is not installed; using the pure-Python Redis parser")
+
+    # Blocking pool: when all connections are busy, callers wait up to
+    # REDIS_POOL_TIMEOUT instead of failing with "Too many connections"
+    return BlockingConnectionPool.from_url(
         str(settings.REDIS_URL),
-        encoding="utf-8",
-        decode_responses=True,
         max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+        timeout=settings.REDIS_POOL_TIMEOUT,
         retry_on_timeout=True,
         health_check_interval=30,
     )
@@ -62,7 +82,7 @@ async def get_redis() -> redis.Redis:
 
 
 # Cache helper functions
-async def cache_get(key: str) -> str | None:
+async def cache_get(key: str) -> bytes | None:
     """Get value from Redis cache."""
     try:
         client = get_redis_client()
@@ -72,7 +92,7 @@ async def cache_get(key: str) -> str | None:
         return None
 
 
-async def cache_set(key: str, value: str, ttl: int | None = None) -> bool:
+async def cache_set(key: str, value: str | bytes, ttl: int | None = None) -> bool:
     """Set value in Redis cache with optional TTL."""
     try:
         client = get_redis_client()
@@ -87,6 +107,7 @@ async def cache_set(key: str, value: str, ttl: int | None = None) -> bool:
 
 async def cache_delete(key: str) -> bool:
     """Delete key from Redis cache."""
+    _local_scrape_cache.delete(key)
     try:
         client = get_redis_client()
         return bool(await client.delete(key))
@@ -96,37 +117,76 @@ async def cache_delete(key: str) -> bool:
 
 
 # URL caching functions
+def _msgpack_default(value: Any) -> Any:
+    """Encode values msgpack has no native type for, matching orjson."""
+    if isinstance(value, date):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    raise TypeError(f"Cannot serialize {type(value).__name__}")
+
+
+def pack_scrape_result(result: dict) -> bytes:
+    """Serialize a scrape result for Redis with MessagePack."""
+    return msgpack.packb(result, use_bin_type=True, default=_msgpack_default)
+
+
+def unpack_scrape_result(data: bytes) -> dict:
+    """Deserialize a scrape result written by pack_scrape_result."""
+    return msgpack.unpackb(data, raw=False)
+
+
 def generate_url_cache_key(url: str, selector: str | None = None, options: dict | None = None) -> str:
-    """Generate cache key for URL scraping results."""
-    cache_data = {
-        "url": url,
-        "selector": selector or "",
-        "options": options or {}
-    }
-    cache_str = json.dumps(cache_data, sort_keys=True)
-    url_hash = hashlib.sha256(cache_str.encode()).hexdigest()[:16]
-    return f"cache:url:{url_hash}"
+    """
+    Generate cache key for URL scraping results.
+
+    The key only needs to be stable, not cryptographically strong, so the
+    parts are fed straight into a 64-bit BLAKE2b digest.
+    """
+    digest = hashlib.blake2b(url.encode(), digest_size=8)
+    digest.update(b"\0")
+    digest.update((selector or "").encode())
+    digest.update(b"\0")
+    if options:
+        digest.update(orjson.dumps(options, option=orjson.OPT_SORT_KEYS))
+    return f"cache:url:{digest.hexdigest()}"
+
+
+def clear_local_scrape_cache() -> None:
+    """Drop all scrape results cached in this process."""
+    _local_scrape_cache.clear()
 
 
 async def get_cached_scrape_result(url: str, selector: str | None = None, options: dict | None = None) -> dict | None:
-    """Get cached scraping result."""
+    """
+    Get cached scraping result.
+
+    Hot results are kept in process memory for up to a minute, so repeated
+    lookups skip the Redis round-trip.
+    """
     key = generate_url_cache_key(url, selector, options)
+    result = _local_scrape_cache.get(key)
+    if result is not None:
+        return result
+
     cached = await cache_get(key)
     if cached:
         try:
-            return json.loads(cached)
-        except json.JSONDecodeError:
-            logger.warning(f"Invalid JSON in cache key {key}")
+            result = unpack_scrape_result(cached)
+            _local_scrape_cache.set(key, result)
+            return result
+        except (msgpack.UnpackException, ValueError):
+            logger.warning(f"Invalid MessagePack data in cache key {key}")
             await cache_delete(key)
     return None
 
 
 async def set_cached_scrape_result(url: str, result: dict, selector: str | None = None, options: dict | None = None) -> bool:
     """Cache scraping result with TTL."""
-    settings = get_settings()
     key = generate_url_cache_key(url, selector, options)
+    _local_scrape_cache.delete(key)
     try:
-        return await cache_set(key, json.dumps(result), ttl=settings.CACHE_TTL)
+        return await cache_set(key, pack_scrape_result(result), ttl=_settings.CACHE_TTL)
     except Exception as e:
         logger.error(f"Failed to cache scrape result: {e}")
         return False
@@ -135,7 +195,7 @@ async def set_cached_scrape_result(url: str, result: dict, selector: str | None
 # Rate limiting functions
 async def rate_limit_check(identifier: str, limit: int, window_seconds: int = 60) -> dict[str, Any]:
     """
-    Check rate limit for identifier using sliding window.
+    Check a single fixed-window rate limit for identifier.
 
     Args:
         identifier: Rate limit identifier (IP, API key, etc.)
@@ -145,41 +205,267 @@ async def rate_limit_check(identifier: str, limit: int, window_seconds: int = 60
     Returns:
         Dict with allowed status, current count, and reset time
     """
+    results = await rate_limit_check_windows(
+        identifier, [(f"{window_seconds}s", limit, window_seconds)]
+    )
+    return results[0]
+
+
+# Atomically increment each window counter and report its count and TTL.
+# KEYS: one counter key per window; ARGV: window length in seconds per key.
+RATE_LIMIT_LUA = """
+local result = {}
+for i, key in ipairs(KEYS) do
+    local count = redis.call('INCR', key)
+    if count == 1 then
+        redis.call('EXPIRE', key, ARGV[i])
+    end
+    local ttl = redis.call('TTL', key)
+    if ttl < 0 then
+        redis.call('EXPIRE', key, ARGV[i])
+        ttl = tonumber(ARGV[i])
+    end
+    result[#result + 1] = count
+    result[#result + 1] = ttl
+end
+return result
+"""
+
+_rate_limit_script = None
+
+
+def _get_rate_limit_script(client: redis.Redis):
+    """Register the rate limit script once; redis-py caches its SHA."""
+    global _rate_limit_script
+
+    if _rate_limit_script is None or _rate_limit_script.registered_client is not client:
+        _rate_limit_script = client.register_script(RATE_LIMIT_LUA)
+    return _rate_limit_script
+
+
+async def _rate_limit_pipeline(
+    client: redis.Redis, keys: list[str], windows: list[int]
+) -> list[int]:
+    """
+    Increment window counters with one non-transactional pipeline.
+
+    Returns counts and TTLs flattened in the same layout as RATE_LIMIT_LUA.
+    """
+    pipe = client.pipeline(transaction=False)
+    for key, window_seconds in zip(keys, windows, strict=True):
+        pipe.incr(key)
+        pipe.expire(key, window_seconds, nx=True)
+        pipe.ttl(key)
+    replies = await pipe.execute()
+
+    values = []
+    for i, window_seconds in enumerate(windows):
+        count, _, ttl = replies[3 * i:3 * i + 3]
+        values.extend((count, ttl if ttl >= 0 else window_seconds))
+    return values
+
+
+async def rate_limit_check_windows(
+    identifier: str, windows: list[tuple[str, int, int]]
+) -> list[dict[str, Any]]:
+    """
+    Check several fixed-window rate limits in a single Redis round-trip.
+
+    Args:
+        identifier: Rate limit identifier (IP, API key, etc.)
+        windows: List of (window name, limit, window seconds)
+
+    Returns:
+        One dict per window with allowed status, current count, and reset time
+    """
     try:
         client = get_redis_client()
+        keys = [f"rate_limit:{identifier}:{name}" for name, _, _ in windows]
+        args = [window_seconds for _, _, window_seconds in windows]
+        try:
+            values = await _get_rate_limit_script(client)(keys=keys, args=args)
+        except redis.ResponseError as e:
+            # Scripting disabled on this server; fall back to a pipeline
+            logger.debug(f"Rate limit script unavailable, using pipeline: {e}")
+            values = await _rate_limit_pipeline(client, keys, args)
+
         now = datetime.utcnow()
-        now - timedelta(seconds=window_seconds)
+        results = []
+        for i, (_, limit, window_seconds) in enumerate(windows):
+            current_count = int(values[2 * i])
+            ttl = int(values[2 * i + 1])
+            results.append({
+                "allowed": current_count <= limit,
+                "current_count": current_count,
+                "limit": limit,
+                "reset_time": (now + timedelta(seconds=ttl)).isoformat(),
+                "reset_seconds": ttl,
+                "window_seconds": window_seconds,
+            })
+        return results
 
-        # Use minute-based key for simplicity
-        minute_key = f"rate_limit:{identifier}:{now.strftime('%Y-%m-%d-%H-%M')}"
+    except Exception as e:
+        logger.error(f"Rate limit check error for {identifier}: {e}")
+        # Allow on error to prevent blocking service
+        return [
+            {"allowed": True, "current_count": 0, "limit": limit, "error": str(e)}
+            for _, limit, _ in windows
+        ]
 
-        # Get current count and increment
-        current_count = await client.incr(minute_key)
 
-        # Set expiration on first increment
-        if current_count == 1:
-            await client.expire(minute_key, window_seconds)
+# API key caching functions
+def _api_key_cache_key(key_hash: str) -> str:
+    """Generate cache key for an API key validation snapshot."""
+    return f"auth:{key_hash}"
 
-        allowed = current_count <= limit
-        reset_time = now + timedelta(seconds=window_seconds)
 
-        return {
-            "allowed": allowed,
-            "current_count": current_count,
-            "limit": limit,
-            "reset_time": reset_time.isoformat(),
-            "window_seconds": window_seconds,
-        }
+async def get_cached_api_key(key_hash: str) -> dict | None:
+    """Get cached API key snapshot by key hash."""
+    key = _api_key_cache_key(key_hash)
+    cached = await cache_get(key)
+    if cached:
+        try:
+            return orjson.loads(cached)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Invalid JSON in cache key {key}")
+            await cache_delete(key)
+    return None
+
+
+async def set_cached_api_key(key_hash: str, snapshot: dict) -> bool:
+    """Cache API key snapshot with a short TTL."""
+    return await cache_set(
+        _api_key_cache_key(key_hash),
+        orjson.dumps(snapshot),
+        ttl=_settings.API_KEY_CACHE_TTL,
+    )
+
+
+# Job response caching functions
+def _job_response_cache_key(job_id: str) -> str:
+    """Generate cache key for a finished job's serialized details."""
+    return f"cache:job:{job_id}"
+
+
+async def get_cached_job_response(job_id: str) -> dict | None:
+    """
+    Get the cached details response of a finished job.
 
+    Returns a dict with ``etag``, ``api_key_id`` and the JSON ``body``.
+    """
+    key = _job_response_cache_key(job_id)
+    cached = await cache_get(key)
+    if cached:
+        try:
+            return orjson.loads(cached)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Invalid JSON in cache key {key}")
+            await cache_delete(key)
+    return None
+
+
+async def set_cached_job_response(job_id: str, etag: str, api_key_id: str | None, body: str) -> bool:
+    """Cache the serialized details response of a finished job."""
+    return await cache_set(
+        _job_response_cache_key(job_id),
+        orjson.dumps({"etag": etag, "api_key_id": api_key_id, "body": body}),
+        ttl=_settings.JOB_RESPONSE_CACHE_TTL,
+    )
+
+
+# Job statistics caching functions
+JOB_STATS_CACHE_TTL = 10
+
+
+def _job_stats_cache_key(api_key_id: str | None) -> str:
+    """Generate cache key for job statistics of one API key or all jobs."""
+    return f"stats:{api_key_id or 'all'}"
+
+
+async def get_cached_job_stats(api_key_id: str | None) -> dict | None:
+    """Get job statistics cached by any API process."""
+    key = _job_stats_cache_key(api_key_id)
+    cached = await cache_get(key)
+    if cached:
+        try:
+            return orjson.loads(cached)
+        except orjson.JSONDecodeError:
+            logger.warning(f"Invalid JSON in cache key {key}")
+            await cache_delete(key)
+    return None
+
+
+async def set_cached_job_stats(api_key_id: str | None, stats: dict) -> bool:
+    """Cache job statistics for a few seconds."""
+    return await cache_set(
+        _job_stats_cache_key(api_key_id),
+        orjson.dumps(stats),
+        ttl=JOB_STATS_CACHE_TTL,
+    )
+
+
+# API key usage tracking functions
+API_KEY_USAGE_COUNTS_KEY = "api_key:usage:counts"
+API_KEY_USAGE_LAST_USED_KEY = "api_key:usage:last_ts"
+
+
+async def record_api_key_usage(api_key_id: str) -> None:
+    """
+    Buffer an API key usage event in Redis.
+
+    Counts and last-used timestamps are written to the database in bulk by
+    the usage flusher instead of committing on every request.
+    """
+    try:
+        client = get_redis_client()
+        pipe = client.pipeline(transaction=False)
+        pipe.hincrby(API_KEY_USAGE_COUNTS_KEY, api_key_id, 1)
+        pipe.hset(API_KEY_USAGE_LAST_USED_KEY, api_key_id, datetime.now(UTC).isoformat())
+        await pipe.execute()
     except Exception as e:
-        logger.error(f"Rate limit check error for {identifier}: {e}")
-        # Allow on error to prevent blocking service
-        return {
-            "allowed": True,
-            "current_count": 0,
-            "limit": limit,
-            "error": str(e),
-        }
+        logger.error(f"Failed to record usage for API key {api_key_id}: {e}")
+
+
+async def drain_api_key_usage() -> dict[str, tuple[int, datetime | None]]:
+    """
+    Atomically read and clear buffered API key usage.
+
+    Returns:
+        Dict mapping API key ID to (request count, last used timestamp)
+    """
+    client = get_redis_client()
+    pipe = client.pipeline(transaction=True)
+    pipe.hgetall(API_KEY_USAGE_COUNTS_KEY)
+    pipe.hgetall(API_KEY_USAGE_LAST_USED_KEY)
+    pipe.delete(API_KEY_USAGE_COUNTS_KEY, API_KEY_USAGE_LAST_USED_KEY)
+    counts, last_used, _ = await pipe.execute()
+
+    usage = {}
+    for api_key_id, count in counts.items():
+        timestamp = last_used.get(api_key_id)
+        if timestamp:
+            timestamp = datetime.fromisoformat(timestamp.decode())
+            if timestamp.tzinfo is None:
+                # Buffered before timestamps were recorded as aware UTC
+                timestamp = timestamp.replace(tzinfo=UTC)
+        usage[api_key_id.decode()] = (int(count), timestamp or None)
+    return usage
+
+
+async def restore_api_key_usage(usage: dict[str, tuple[int, datetime | None]]) -> None:
+    """
+    Put drained API key usage back after it failed to reach the database.
+
+    Counts are added to anything recorded since the drain; a last-used
+    timestamp recorded since then is newer and is kept.
+    """
+    client = get_redis_client()
+    pipe = client.pipeline(transaction=True)
+    for api_key_id, (count, last_used) in usage.items():
+        pipe.hincrby(API_KEY_USAGE_COUNTS_KEY, api_key_id, count)
+        if last_used is not None:
+            pipe.hsetnx(API_KEY_USAGE_LAST_USED_KEY, api_key_id, last_used.isoformat())
+    await pipe.execute()
 
 
 # Job queue functions
@@ -206,7 +492,7 @@ async def dequeue_job(timeout: int = 5) -> str | None:
         # Use BZPOPMIN for blocking pop with lowest score (highest priority)
         result = await client.bzpopmin(queue_key, timeout=timeout)
         if result:
-            return result[1]  # Return job_id (result is (key, job_id, score))
+            return result[1].decode()  # Return job_id (result is (key, job_id, score))
         return None
     except Exception as e:
         logger.error(f"Failed to dequeue job: {e}")
@@ -224,20 +510,37 @@ async def get_queue_size() -> int:
 
 
 # Job status functions
+async def _write_job_status(client: redis.Redis, key: str, fields: dict[str, Any]) -> None:
+    """Write job status fields and refresh the TTL in one round-trip."""
+    pipe = client.pipeline(transaction=False)
+    pipe.hset(key, mapping=fields)
+    pipe.expire(key, _settings.JOB_STATUS_TTL)
+    await pipe.execute()
+
+
 async def set_job_status(job_id: str, status: str, data: dict | None = None) -> bool:
-    """Set job status with optional data."""
+    """
+    Set job status with optional data.
+
+    The status is stored as a hash so it can be written without encoding a
+    wrapper document; only ``data`` is serialized.
+    """
     try:
-        settings = get_settings()
-        get_redis_client()
+        client = get_redis_client()
         key = f"job_status:{job_id}"
-
-        status_data = {
+        fields = {
             "status": status,
             "timestamp": datetime.utcnow().isoformat(),
-            "data": data or {}
+            "data": orjson.dumps(data or {}),
         }
 
-        return await cache_set(key, json.dumps(status_data), ttl=settings.JOB_STATUS_TTL)
+        try:
+            await _write_job_status(client, key, fields)
+        except redis.ResponseError:
+            # Key still holds a status in the older JSON string format
+            await client.delete(key)
+            await _write_job_status(client, key, fields)
+        return True
     except Exception as e:
         logger.error(f"Failed to set job status for {job_id}: {e}")
         return False
@@ -246,11 +549,16 @@ async def set_job_status(job_id: str, status: str, data: dict | None = None) ->
 async def get_job_status(job_id: str) -> dict | None:
     """Get job status and data."""
     try:
-        key = f"job_status:{job_id}"
-        cached = await cache_get(key)
-        if cached:
-            return json.loads(cached)
-        return None
+        client = get_redis_client()
+        fields = await client.hgetall(f"job_status:{job_id}")
+        if not fields:
+            return None
+        data = fields.get(b"data")
+        return {
+            "status": fields[b"status"].decode(),
+            "timestamp": fields[b"timestamp"].decode(),
+            "data": orjson.loads(data) if data else {},
+        }
     except Exception as e:
         logger.error(f"Failed to get job status for {job_id}: {e}")
         return None
@@ -278,9 +586,14 @@ async def check_redis_health() -> dict[str, Any]:
         # Get Redis info
         info = await client.info()
 
+        pool = client.connection_pool
+
         return {
             "status": "healthy",
             "connected": True,
+            "pool_max_connections": pool.max_connections,
+            "pool_in_use": len(pool._in_use_connections),
+            "pool_idle": len(pool._available_connections),
             "redis_version": info.get("redis_version"),
             "connected_clients": info.get("connected_clients", 0),
             "used_memory": info.get("used_memory", 0),
@@ -0,0 +1,23 @@
+"""Cheap timestamp helpers for frequently polled endpoints."""
+
+import time
+from datetime import datetime
+
+_cached_second: int = -1
+_cached_iso: str = ""
+
+
+def utcnow_iso() -> str:
+    """
+    Get the current UTC time as an ISO 8601 string at 1-second resolution.
+
+    The string is rebuilt only when the second changes, so repeated calls
+    within the same second avoid allocating and formatting a datetime.
+    """
+    global _cached_second, _cached_iso
+
+    second = time.time_ns() // 1_000_000_000
+    if second != _cached_second:
+        _cached_iso = datetime.utcfromtimestamp(second).isoformat()
+        _cached_second = second
+    return _cached_iso
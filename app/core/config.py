@@ -4,6 +4,7 @@ Configuration management using Pydantic BaseSettings.
 This module handles all environment variable configuration for the application.
 """
 
+from functools import lru_cache
 from typing import Literal
 
 from pydantic import Field
@@ -28,10 +29,32 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = Field(default="password", description="PostgreSQL password")
 
     # Database Pool Settings
-    DB_POOL_SIZE: int = Field(default=10, description="Database connection pool size")
-    DB_MAX_OVERFLOW: int = Field(default=0, description="Database connection pool max overflow")
+    # Each in-flight request holds a connection for its whole lifetime, so size
+    # pools per worker process so that DB_POOL_SIZE + DB_MAX_OVERFLOW covers
+    # the expected concurrent requests. Across all API and worker processes
+    # the total must stay below the server's max_connections (100 by default),
+    # so the defaults are fixed rather than scaled with the host's CPUs.
+    DB_POOL_SIZE: int = Field(default=20, description="Database connection pool size")
+    DB_MAX_OVERFLOW: int = Field(default=40, description="Database connection pool max overflow")
+    # Short on purpose: an exhausted pool should fail fast, not stall requests
+    DB_POOL_TIMEOUT: int = Field(
+        default=5,
+        description="Seconds to wait for a database connection from the pool"
+    )
+    DB_POOL_RECYCLE: int = Field(
+        default=3600,
+        description="Recycle database connections after this many seconds"
+    )
     DB_POOL_PRE_PING: bool = Field(default=True, description="Enable database connection pre-ping")
     DB_ECHO: bool = Field(default=False, description="Enable SQL query logging")
+    DB_POOL_LOG_INTERVAL: int = Field(
+        default=300,
+        description="Seconds between database pool high-water mark log lines"
+    )
+    DB_QUERY_CACHE_SIZE: int = Field(
+        default=1200,
+        description="Number of compiled SQL statements cached per engine"
+    )
 
     # Redis Configuration
     REDIS_URL: str = Field(
@@ -42,8 +65,25 @@ class Settings(BaseSettings):
     REDIS_PORT: int = Field(default=6379, description="Redis port")
     REDIS_PASSWORD: str | None = Field(default=None, description="Redis password")
     REDIS_DB: int = Field(default=0, description="Redis database number")
+    # When Redis runs on the same host as the app, point this at its
+    # unixsocket so the worker/API connections skip the TCP stack
+    REDIS_SOCKET_PATH: str | None = Field(
+        default=None,
+        description="Redis Unix socket path; overrides REDIS_HOST/REDIS_PORT when set"
+    )
     REDIS_POOL_SIZE: int = Field(default=10, description="Redis connection pool size")
-    REDIS_POOL_MAX_CONNECTIONS: int = Field(default=20, description="Redis max connections")
+    REDIS_POOL_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Redis max connections (pipelines and blocking commands each hold one)"
+    )
+    REDIS_POOL_TIMEOUT: float = Field(
+        default=5.0,
+        description="Seconds to wait for a free Redis connection when the pool is exhausted"
+    )
+    REDIS_AUTO_PIPELINE: bool = Field(
+        default=True,
+        description="Batch Redis commands issued in the same event loop tick into one pipeline"
+    )
 
     # API Configuration
     API_HOST: str = Field(default="0.0.0.0", description="API server host")
@@ -58,6 +98,11 @@ class Settings(BaseSettings):
         description="JWT secret key"
     )
     API_KEY_HEADER: str = Field(default="X-API-Key", description="API key header name")
+    API_KEY_CACHE_TTL: int = Field(default=60, description="API key validation cache TTL in seconds")
+    API_KEY_USAGE_FLUSH_INTERVAL: int = Field(
+        default=30,
+        description="Interval in seconds for flushing buffered API key usage to the database"
+    )
 
     # Rate Limiting
     RATE_LIMIT_PER_MINUTE: int = Field(default=60, description="Rate limit per minute")
@@ -104,6 +149,10 @@ class Settings(BaseSettings):
     CACHE_TTL: int = Field(default=3600, description="Cache TTL in seconds")
     JOB_STATUS_TTL: int = Field(default=86400, description="Job status TTL in seconds")
     RESULT_CACHE_TTL: int = Field(default=86400, description="Result cache TTL")
+    JOB_RESPONSE_CACHE_TTL: int = Field(
+        default=300,
+        description="Cache TTL in seconds for serialized details of finished jobs"
+    )
 
     # Worker Configuration
     CELERY_BROKER_URL: str = Field(
@@ -171,16 +220,10 @@ class Settings(BaseSettings):
         case_sensitive = False
 
 
-# Global settings instance
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
     """Get the global settings instance."""
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
 
 
 settings = get_settings()
@@ -1,12 +1,15 @@
 """Database connection and session management with connection pooling."""
 
+import asyncio
 import logging
 from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
+from typing import Any
 
+import orjson
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import text
 
 from app.core.config import settings
 
@@ -15,6 +18,12 @@ logger = logging.getLogger(__name__)
 # Create declarative base for models
 Base = declarative_base()
 
+
+def _json_serializer(value: Any) -> str:
+    """Serialize JSON column values with orjson."""
+    return orjson.dumps(value).decode()
+
+
 # Create async engine with connection pooling
 engine = create_async_engine(
     settings.DATABASE_URL,
@@ -22,16 +31,25 @@ engine = create_async_engine(
     pool_size=settings.DB_POOL_SIZE,
     max_overflow=settings.DB_MAX_OVERFLOW,
     pool_pre_ping=settings.DB_POOL_PRE_PING,
-    pool_recycle=3600,  # Recycle connections after 1 hour
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Roll back whatever a session left open before the connection is reused
+    pool_reset_on_return="rollback",
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,
     # Engine options
     echo=settings.DB_ECHO,
     echo_pool=False,
     future=True,
+    # JSONB columns are encoded and decoded with orjson instead of stdlib json
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
     # Connection options for PostgreSQL
     connect_args={
         "server_settings": {
             "application_name": "web-scraping-api",
         },
+        # Per-connection cache of prepared statements, keyed by compiled SQL
+        "prepared_statement_cache_size": 256,
     },
 )
 
@@ -95,6 +113,32 @@ async def close_db() -> None:
     logger.info("Database connections closed")
 
 
+async def run_pool_monitor(interval: float) -> None:
+    """
+    Log the connection pool's high-water mark every ``interval`` seconds.
+
+    Checked-out connections are sampled once a second; the peak since the
+    previous log line is reported so pool sizing can be tuned from logs.
+    """
+    pool = engine.pool
+    high_water = 0
+    elapsed = 0.0
+    while True:
+        await asyncio.sleep(1)
+        elapsed += 1
+        try:
+            high_water = max(high_water, pool.checkedout())
+            if elapsed >= interval:
+                logger.info(
+                    f"Database pool high-water mark: {high_water} checked out "
+                    f"(pool_size={pool.size()}, overflow={pool.overflow()})"
+                )
+                high_water = 0
+                elapsed = 0.0
+        except Exception as e:
+            logger.error(f"Failed to sample database pool: {e}")
+
+
 async def check_database_health() -> dict:
     """
     Check database connectivity and return health status.
@@ -103,9 +147,9 @@ async def check_database_health() -> dict:
         Dict with health status, connection info, and any errors.
     """
     try:
-        async with engine.begin() as conn:
-            result = await conn.execute(text("SELECT 1"))
-            result.fetchone()
+        # No transaction needed for a ping; skips the BEGIN/COMMIT pair
+        async with engine.connect() as conn:
+            await conn.scalar(text("SELECT 1"))
 
         pool = engine.pool
         return {
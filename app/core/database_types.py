@@ -1,7 +1,9 @@
 """Database type compatibility utilities for cross-database support."""
 
-from sqlalchemy import JSON, Text
+from sqlalchemy import JSON, Integer, Text
 from sqlalchemy.dialects.postgresql import JSONB as PostgresJSONB, UUID as PostgresUUID
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.functions import FunctionElement
 from sqlalchemy.sql import type_api
 from sqlalchemy.types import TypeDecorator
 import uuid as uuid_lib
@@ -21,6 +23,25 @@ class JSONType(TypeDecorator):
             return dialect.type_descriptor(JSON())
 
 
+class json_array_length(FunctionElement):
+    """Cross-database JSON array length (jsonb_array_length on PostgreSQL)."""
+
+    type = Integer()
+    inherit_cache = True
+    name = "json_array_length"
+
+
+@compiles(json_array_length)
+def _compile_json_array_length(element, compiler, **kw):
+    return f"json_array_length({compiler.process(element.clauses, **kw)})"
+
+
+@compiles(json_array_length, "postgresql")
+def _compile_jsonb_array_length(element, compiler, **kw):
+    # A Python None is stored as a JSON null, which jsonb_array_length rejects.
+    return f"jsonb_array_length(nullif({compiler.process(element.clauses, **kw)}, 'null'::jsonb))"
+
+
 class UUIDType(TypeDecorator):
     """Cross-database UUID type that uses PostgreSQL UUID for PostgreSQL and Text for others."""
     
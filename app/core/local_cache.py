@@ -0,0 +1,108 @@
+"""
+In-process TTL caching utilities.
+
+Provides a small time-based cache and a decorator for memoizing async
+functions (including route handlers) for a few seconds per process.
+"""
+
+import asyncio
+import functools
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable, Hashable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+_MISSING = object()
+
+
+class TTLCache:
+    """Bounded mapping whose entries expire ``ttl`` seconds after being set."""
+
+    def __init__(self, ttl: float, maxsize: int = 1024):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Get a cached value, or ``default`` if missing or expired."""
+        entry = self._data.get(key)
+        if entry is None:
+            return default
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            return default
+
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Cache a value, evicting the least recently used entry when full."""
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> None:
+        """Remove a cached value if present."""
+        self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Remove all cached values."""
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+def cached(
+    ttl: float,
+    key: Callable[..., Hashable] | None = None,
+    maxsize: int = 1024,
+) -> Callable[[Callable[..., Awaitable[T]]], Callable[..., Awaitable[T]]]:
+    """
+    Cache results of an async function in-process for ``ttl`` seconds.
+
+    Args:
+        ttl: Time to live in seconds
+        key: Builds the cache key from the call's arguments; by default
+            all calls share a single entry
+        maxsize: Maximum number of cached entries
+
+    Concurrent misses for the same key are collapsed into a single call.
+    Exceptions are not cached. The wrapped function exposes ``cache`` so
+    callers can inspect or clear it. ``functools.wraps`` keeps the original
+    signature, so the decorator is safe to use on FastAPI route handlers.
+    """
+
+    def decorator(func: Callable[..., Awaitable[T]]) -> Callable[..., Awaitable[T]]:
+        cache = TTLCache(ttl, maxsize=maxsize)
+        locks: dict[Hashable, asyncio.Lock] = {}
+
+        @functools.wraps(func)
+        async def wrapper(*args: Any, **kwargs: Any) -> T:
+            cache_key = key(*args, **kwargs) if key else None
+            value = cache.get(cache_key, _MISSING)
+            if value is not _MISSING:
+                return value
+
+            lock = locks.setdefault(cache_key, asyncio.Lock())
+            try:
+                async with lock:
+                    # Another caller may have filled the cache while we waited
+                    value = cache.get(cache_key, _MISSING)
+                    if value is _MISSING:
+                        value = await func(*args, **kwargs)
+                        cache.set(cache_key, value)
+            finally:
+                if not lock.locked() and locks.get(cache_key) is lock:
+                    del locks[cache_key]
+            return value
+
+        wrapper.cache = cache
+        return wrapper
+
+    return decorator
@@ -0,0 +1,19 @@
+"""Log rendering helpers shared by the API and worker structlog setup."""
+
+from collections.abc import Callable
+from typing import Any
+
+import orjson
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def orjson_dumps(obj: Any, default: Callable[[Any], Any] | None = None, **_kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson for structlog's JSONRenderer.
+
+    ``default`` is structlog's fallback for unserializable values.
+    """
+    # JSONRenderer passes json.dumps-style options (e.g. sort_keys) that
+    # orjson doesn't support; they are accepted and ignored
+    return orjson.dumps(obj, default=default, option=_ORJSON_OPTIONS).decode()
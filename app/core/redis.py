@@ -1,21 +1,110 @@
 """Redis connection and utility functions."""
-import json
+import asyncio
+import hashlib
 import logging
+from functools import lru_cache, partial
 from typing import Any
 from urllib.parse import urlparse
 
+import msgpack
+import orjson
 import redis.asyncio as redis
 from redis.asyncio import Redis
+from redis.asyncio.connection import UnixDomainSocketConnection
+from redis.utils import HIREDIS_AVAILABLE
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Leading byte of values written by RedisCache.set_json; legacy values are
+# plain JSON and start with "{" or "["
+CACHE_FORMAT_VERSION = b"\x01"
+
+# Shared MessagePack encoder; packing is synchronous, so reuse is safe
+_packer = msgpack.Packer(use_bin_type=True)
+
+
+# Non-blocking commands the auto-pipeline batches; anything else (blocking
+# pops, scripts, explicit pipelines, connection management) goes straight
+# to the wrapped client
+AUTO_PIPELINE_COMMANDS = frozenset({
+    "get", "mget", "set", "setex", "delete", "exists", "expire", "ttl",
+    "incr", "incrby", "hget", "hset", "hgetall",
+    "zadd", "zcard", "zrange", "zrem", "zscore",
+})
+
+
+class AutoPipeline:
+    """
+    Redis client proxy that batches commands issued in the same loop tick.
+
+    Calls to AUTO_PIPELINE_COMMANDS return a future and are queued; the
+    queue is flushed once per event loop iteration as a single
+    non-transactional pipeline, so concurrent coroutines share round-trips.
+    Each caller still awaits its own result or error.
+    """
+
+    def __init__(self, client: Redis):
+        self._client = client
+        self._pending: list[tuple[str, tuple, dict, asyncio.Future]] = []
+        self._flushes: set[asyncio.Task] = set()
+
+    def __getattr__(self, name: str) -> Any:
+        if name in AUTO_PIPELINE_COMMANDS:
+            return partial(self._queue, name)
+        return getattr(self._client, name)
+
+    def _queue(self, name: str, *args: Any, **kwargs: Any) -> asyncio.Future:
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            # Runs after every callback already scheduled for this iteration
+            loop.call_soon(self._flush)
+        future = loop.create_future()
+        self._pending.append((name, args, kwargs, future))
+        return future
+
+    def _flush(self) -> None:
+        batch, self._pending = self._pending, []
+        task = asyncio.ensure_future(self._execute(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _execute(self, batch: list[tuple[str, tuple, dict, asyncio.Future]]) -> None:
+        try:
+            if len(batch) == 1:
+                name, args, kwargs, _ = batch[0]
+                results = [await getattr(self._client, name)(*args, **kwargs)]
+            else:
+                pipe = self._client.pipeline(transaction=False)
+                for name, args, kwargs, _ in batch:
+                    getattr(pipe, name)(*args, **kwargs)
+                results = await pipe.execute(raise_on_error=False)
+            # A short reply must fail every caller, not leave some waiting
+            replies = list(zip(batch, results, strict=True))
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), result in replies:
+            if future.done():
+                continue
+            if isinstance(result, Exception):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+
+
+# Clients handed out by get_redis(); AutoPipeline proxies Redis commands
+RedisClient = Redis | AutoPipeline
+
 # Global Redis connection pool
-redis_client: Redis | None = None
+redis_client: RedisClient | None = None
 
 
-async def init_redis() -> Redis:
+async def init_redis() -> RedisClient:
     """Initialize Redis connection."""
     global redis_client
 
@@ -37,7 +126,11 @@ async def init_redis() -> Redis:
         password = None
         logger.warning("REDIS_PASSWORD is empty string, treating as None")
     
-    logger.info(f"Using Redis connection: {host}:{port}, db={db}, auth={'yes' if password else 'no'}")
+    socket_path = settings.REDIS_SOCKET_PATH
+    if socket_path:
+        logger.info(f"Using Redis connection: unix://{socket_path}, db={db}, auth={'yes' if password else 'no'}")
+    else:
+        logger.info(f"Using Redis connection: {host}:{port}, db={db}, auth={'yes' if password else 'no'}")
     
     # Additional debugging
     if password:
@@ -45,17 +138,37 @@ async def init_redis() -> Redis:
     else:
         logger.warning("No Redis password provided, but Redis server requires authentication")
 
-    redis_client = redis.Redis(
-        host=host,
-        port=int(port),
-        db=int(db),
-        password=password,
-        encoding="utf-8",
-        decode_responses=True,
-        socket_keepalive=True,
-        socket_keepalive_options={},
-        health_check_interval=30,
-    )
+    # redis-py picks the C parser automatically when hiredis is importable
+    if not HIREDIS_AVAILABLE:
+        logger.warning("hiredis is not installed; using the pure-Python Redis parser")
+
+    # Bounded pool: bursts wait up to REDIS_POOL_TIMEOUT for a free
+    # connection instead of opening new ones until Redis refuses them
+    if socket_path:
+        # Co-located Redis: a Unix socket skips the TCP/IP stack entirely
+        pool = redis.BlockingConnectionPool(
+            connection_class=UnixDomainSocketConnection,
+            path=socket_path,
+            db=int(db),
+            password=password,
+            max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            health_check_interval=30,
+        )
+    else:
+        pool = redis.BlockingConnectionPool(
+            host=host,
+            port=int(port),
+            db=int(db),
+            password=password,
+            max_connections=settings.REDIS_POOL_MAX_CONNECTIONS,
+            timeout=settings.REDIS_POOL_TIMEOUT,
+            # Replies stay as bytes; msgpack payloads are binary
+            socket_keepalive=True,
+            socket_keepalive_options={},
+            health_check_interval=30,
+        )
+    redis_client = redis.Redis.from_pool(pool)
 
     # Test connection
     try:
@@ -65,10 +178,13 @@ async def init_redis() -> Redis:
         logger.error(f"Failed to connect to Redis: {e}")
         raise
 
+    if settings.REDIS_AUTO_PIPELINE:
+        redis_client = AutoPipeline(redis_client)
+
     return redis_client
 
 
-async def get_redis() -> Redis:
+async def get_redis() -> RedisClient:
     """Get Redis client instance."""
     if not redis_client:
         await init_redis()
@@ -87,10 +203,10 @@ async def close_redis() -> None:
 class RedisCache:
     """Redis cache utility class."""
 
-    def __init__(self, redis_client: Redis):
+    def __init__(self, redis_client: RedisClient):
         self.redis = redis_client
 
-    async def get(self, key: str) -> str | None:
+    async def get(self, key: str) -> bytes | None:
         """Get value from cache."""
         try:
             return await self.redis.get(key)
@@ -101,7 +217,7 @@ class RedisCache:
     async def set(
         self,
         key: str,
-        value: str,
+        value: str | bytes,
         ttl: int | None = None
     ) -> bool:
         """Set value in cache with optional TTL."""
@@ -115,13 +231,20 @@ class RedisCache:
             return False
 
     async def get_json(self, key: str) -> dict[str, Any] | None:
-        """Get JSON value from cache."""
+        """
+        Get a structured value from cache.
+
+        Values are MessagePack behind a format version byte; values written
+        before the switch are still read as JSON.
+        """
         value = await self.get(key)
         if value:
             try:
-                return json.loads(value)
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON decode error for key {key}: {e}")
+                if value[:1] == CACHE_FORMAT_VERSION:
+                    return msgpack.unpackb(value[1:], raw=False)
+                return orjson.loads(value)
+            except (msgpack.UnpackException, ValueError) as e:
+                logger.error(f"Decode error for key {key}: {e}")
                 return None
         return None
 
@@ -131,12 +254,28 @@ class RedisCache:
         value: dict[str, Any],
         ttl: int | None = None
     ) -> bool:
-        """Set JSON value in cache with optional TTL."""
+        """Set a structured value in cache, encoded as MessagePack, with optional TTL."""
         try:
-            json_value = json.dumps(value)
-            return await self.set(key, json_value, ttl)
+            packed = CACHE_FORMAT_VERSION + _packer.pack(value)
+            return await self.set(key, packed, ttl)
         except Exception as e:
-            logger.error(f"JSON encode error for key {key}: {e}")
+            logger.error(f"Encode error for key {key}: {e}")
+            return False
+
+    async def set_many_json(
+        self,
+        items: dict[str, dict[str, Any]],
+        ttl: int | None = None
+    ) -> bool:
+        """Set several structured values, encoded like set_json, in one pipelined round-trip."""
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            for key, value in items.items():
+                pipe.set(key, CACHE_FORMAT_VERSION + _packer.pack(value), ex=ttl)
+            await pipe.execute()
+            return True
+        except Exception as e:
+            logger.error(f"Redis batch SET error for {len(items)} keys: {e}")
             return False
 
     async def delete(self, key: str) -> bool:
@@ -165,11 +304,37 @@ class RedisCache:
             return False
 
 
+# GCRA check: the key holds the theoretical arrival time (TAT) of the next
+# request; each request pushes it one emission interval (window / limit)
+# forward and is allowed while the TAT stays within one window of now.
+# The clock is Redis TIME, shared by every API and worker process.
+# KEYS[1]: TAT key; ARGV: window, limit.
+# Returns {allowed, remaining, reset timestamp}; floats as strings.
+GCRA_LUA = """
+local time = redis.call('TIME')
+local now = tonumber(time[1]) + tonumber(time[2]) / 1000000
+local window = tonumber(ARGV[1])
+local interval = window / tonumber(ARGV[2])
+local tat = tonumber(redis.call('GET', KEYS[1])) or now
+if tat < now then
+    tat = now
+end
+local new_tat = tat + interval
+local allow_at = new_tat - window
+if allow_at > now then
+    return {0, 0, tostring(allow_at)}
+end
+redis.call('SET', KEYS[1], tostring(new_tat), 'PX', math.ceil((new_tat - now) * 1000))
+return {1, math.floor((now - allow_at) / interval), tostring(new_tat)}
+"""
+
+
 class RedisRateLimiter:
     """Redis-based rate limiter."""
 
-    def __init__(self, redis_client: Redis):
+    def __init__(self, redis_client: RedisClient):
         self.redis = redis_client
+        self._gcra_script = None
 
     async def is_allowed(
         self,
@@ -181,6 +346,10 @@ class RedisRateLimiter:
         """
         Check if request is allowed within rate limit.
 
+        Uses GCRA in one Lua script call: a single float per key and O(1)
+        work, allowing bursts of up to ``limit`` requests. Servers without
+        scripting fall back to a fixed-window counter.
+
         Args:
             key: Base key for rate limiting (e.g., "api_key:12345")
             limit: Number of requests allowed
@@ -190,42 +359,26 @@ class RedisRateLimiter:
         Returns:
             tuple: (is_allowed, {"remaining": int, "reset_time": int})
         """
-        rate_key = f"rate_limit:{key}:{identifier}"
+        rate_key = f"rate_limit:gcra:{key}:{identifier}"
 
         try:
-            # Use sliding window rate limiting
-            current_time = await self.redis.time()
-            current_timestamp = current_time[0]  # Unix timestamp
-
-            # Remove old entries outside the window
-            cutoff = current_timestamp - window
-            await self.redis.zremrangebyscore(rate_key, 0, cutoff)
-
-            # Count current requests
-            current_count = await self.redis.zcard(rate_key)
-
-            if current_count >= limit:
-                # Get the oldest entry to calculate reset time
-                oldest_entries = await self.redis.zrange(rate_key, 0, 0, withscores=True)
-                reset_time = int(oldest_entries[0][1] + window) if oldest_entries else current_timestamp + window
-
-                return False, {
-                    "remaining": 0,
-                    "reset_time": reset_time,
-                    "limit": limit,
-                    "window": window
-                }
-
-            # Add current request
-            await self.redis.zadd(rate_key, {str(current_timestamp): current_timestamp})
-            await self.redis.expire(rate_key, window)
-
-            remaining = limit - current_count - 1
-            reset_time = current_timestamp + window
-
-            return True, {
-                "remaining": remaining,
-                "reset_time": reset_time,
+            try:
+                if self._gcra_script is None:
+                    self._gcra_script = self.redis.register_script(GCRA_LUA)
+                allowed, remaining, reset_time = await self._gcra_script(
+                    keys=[rate_key],
+                    args=[window, limit],
+                )
+            except redis.ResponseError as e:
+                # Scripting disabled on this server; fall back to a pipeline
+                logger.debug(f"Rate limit script unavailable, using pipeline: {e}")
+                allowed, remaining, reset_time = await self._is_allowed_pipeline(
+                    rate_key, limit, window
+                )
+
+            return bool(allowed), {
+                "remaining": int(remaining),
+                "reset_time": int(float(reset_time)),
                 "limit": limit,
                 "window": window
             }
@@ -240,14 +393,70 @@ class RedisRateLimiter:
                 "window": window
             }
 
+    async def _is_allowed_pipeline(
+        self,
+        rate_key: str,
+        limit: int,
+        window: int,
+    ) -> tuple[bool, int, float]:
+        """Count the request in a fixed window; returns values in the layout of GCRA_LUA."""
+        # Windows follow Redis TIME so every process agrees on them
+        seconds, _ = await self.redis.time()
+        window_index = seconds // window
+        pipe = self.redis.pipeline(transaction=False)
+        pipe.incr(f"{rate_key}:{window_index}")
+        pipe.expire(f"{rate_key}:{window_index}", window)
+        current_count, _ = await pipe.execute()
+
+        reset_time = (window_index + 1) * window
+        if current_count > limit:
+            return False, 0, reset_time
+        return True, limit - current_count, reset_time
+
+
+# Pop up to ARGV[1] highest-priority jobs and move them to the processing set.
+# KEYS[1]: queue, KEYS[2]: processing queue. Returns job ids, highest first.
+DEQUEUE_BATCH_LUA = """
+local entries = redis.call('ZREVRANGE', KEYS[1], 0, tonumber(ARGV[1]) - 1, 'WITHSCORES')
+local job_ids = {}
+for i = 1, #entries, 2 do
+    redis.call('ZADD', KEYS[2], entries[i + 1], entries[i])
+    job_ids[#job_ids + 1] = entries[i]
+end
+if #job_ids > 0 then
+    redis.call('ZREM', KEYS[1], unpack(job_ids))
+end
+return job_ids
+"""
+
+
+# Fold the sample ARGV[1] into the moving average at KEYS[1] with weight ARGV[2].
+# Returns the new average as a string to keep its fractional part.
+EXECUTION_TIME_EWMA_LUA = """
+local sample = tonumber(ARGV[1])
+local avg = tonumber(redis.call('GET', KEYS[1]))
+if avg then
+    avg = avg + tonumber(ARGV[2]) * (sample - avg)
+else
+    avg = sample
+end
+redis.call('SET', KEYS[1], tostring(avg))
+return tostring(avg)
+"""
+
+# Moving average of job execution time in seconds, updated by workers
+EXECUTION_TIME_KEY = "stats:avg_exec"
+
 
 class RedisQueue:
     """Redis-based job queue."""
 
-    def __init__(self, redis_client: Redis, queue_name: str = "scraping_queue"):
+    def __init__(self, redis_client: RedisClient, queue_name: str = "scraping_queue"):
         self.redis = redis_client
         self.queue_name = queue_name
         self.processing_queue = f"{queue_name}:processing"
+        self._dequeue_batch_script = None
+        self._execution_time_script = None
 
     async def enqueue(self, job_id: str, priority: int = 0) -> bool:
         """Add job to queue with priority."""
@@ -259,21 +468,127 @@ class RedisQueue:
             logger.error(f"Queue enqueue error for job {job_id}: {e}")
             return False
 
-    async def dequeue(self, timeout: int = 10) -> str | None:
-        """Get next job from queue (blocking)."""
+    async def enqueue_many(self, items: list[tuple[str, int]]) -> int:
+        """
+        Add several jobs to the queue with a single ZADD.
+
+        Args:
+            items: List of (job_id, priority) pairs
+
+        Returns:
+            Number of jobs newly added to the queue
+        """
+        if not items:
+            return 0
         try:
-            # Get highest priority job
-            result = await self.redis.bzpopmax(self.queue_name, timeout=timeout)
-            if result:
-                _queue_name, job_id, priority = result
-                # Move to processing queue
-                await self.redis.zadd(self.processing_queue, {job_id: priority})
-                return job_id
+            return await self.redis.zadd(self.queue_name, dict(items))
+        except Exception as e:
+            logger.error(f"Queue enqueue error for {len(items)} jobs: {e}")
+            return 0
+
+    async def enqueue_many_with_stats(
+        self, items: list[tuple[str, int]]
+    ) -> tuple[int, int, float | None]:
+        """
+        Enqueue jobs and read the queue backlog in one round-trip.
+
+        Args:
+            items: List of (job_id, priority) pairs
+
+        Returns:
+            Tuple of (jobs newly added, queue size after adding,
+            average execution time in seconds or None if unknown)
+        """
+        if not items:
+            return 0, 0, None
+        try:
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zadd(self.queue_name, dict(items))
+            pipe.zcard(self.queue_name)
+            pipe.get(EXECUTION_TIME_KEY)
+            added, queue_size, avg_execution_time = await pipe.execute()
+            return (
+                added,
+                queue_size,
+                float(avg_execution_time) if avg_execution_time else None,
+            )
+        except Exception as e:
+            logger.error(f"Queue enqueue error for {len(items)} jobs: {e}")
+            return 0, 0, None
+
+    async def record_execution_time(self, seconds: float, weight: float = 0.2) -> float | None:
+        """
+        Update the moving average of job execution time.
+
+        Args:
+            seconds: Execution time of a finished job
+            weight: Weight of the new sample in the average
+
+        Returns:
+            The updated average, or None on error
+        """
+        try:
+            if self._execution_time_script is None:
+                self._execution_time_script = self.redis.register_script(EXECUTION_TIME_EWMA_LUA)
+            avg = await self._execution_time_script(keys=[EXECUTION_TIME_KEY], args=[seconds, weight])
+            return float(avg)
+        except Exception as e:
+            logger.error(f"Failed to record execution time: {e}")
             return None
+
+    async def _pop_ready(self, count: int) -> list[str]:
+        """Move up to ``count`` highest-priority jobs to the processing queue atomically."""
+        if self._dequeue_batch_script is None:
+            self._dequeue_batch_script = self.redis.register_script(DEQUEUE_BATCH_LUA)
+        job_ids = await self._dequeue_batch_script(
+            keys=[self.queue_name, self.processing_queue],
+            args=[count],
+        )
+        return [job_id.decode() for job_id in job_ids]
+
+    async def _pop_blocking(self, timeout: int) -> str | None:
+        """Wait for a job with BZPOPMAX and move it to the processing queue."""
+        result = await self.redis.bzpopmax(self.queue_name, timeout=timeout)
+        if result:
+            _queue_name, job_id, priority = result
+            # Move to processing queue
+            await self.redis.zadd(self.processing_queue, {job_id: priority})
+            return job_id.decode()
+        return None
+
+    async def dequeue(self, timeout: int = 10) -> str | None:
+        """
+        Get next job from queue (blocking).
+
+        A waiting job is popped and moved to the processing queue in one
+        atomic round-trip; only an empty queue falls back to BZPOPMAX.
+        """
+        try:
+            job_ids = await self._pop_ready(1)
+            if job_ids:
+                return job_ids[0]
+            return await self._pop_blocking(timeout)
         except Exception as e:
             logger.error(f"Queue dequeue error: {e}")
             return None
 
+    async def dequeue_batch(self, batch_size: int, timeout: int = 10) -> list[str]:
+        """
+        Get up to ``batch_size`` jobs from the queue in one round-trip.
+
+        Jobs are moved to the processing queue atomically. If the queue is
+        empty, blocks like dequeue() for a single job.
+        """
+        try:
+            job_ids = await self._pop_ready(batch_size)
+            if job_ids:
+                return job_ids
+            job_id = await self._pop_blocking(timeout)
+            return [job_id] if job_id else []
+        except Exception as e:
+            logger.error(f"Queue batch dequeue error: {e}")
+            return []
+
     async def complete_job(self, job_id: str) -> bool:
         """Mark job as completed and remove from processing queue."""
         try:
@@ -297,8 +612,10 @@ class RedisQueue:
     async def get_queue_stats(self) -> dict[str, int]:
         """Get queue statistics."""
         try:
-            pending = await self.redis.zcard(self.queue_name)
-            processing = await self.redis.zcard(self.processing_queue)
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zcard(self.queue_name)
+            pipe.zcard(self.processing_queue)
+            pending, processing = await pipe.execute()
 
             return {
                 "pending": pending,
@@ -327,21 +644,42 @@ async def get_cached_job_result(job_id: str) -> dict[str, Any] | None:
     return await cache.get_json(cache_key)
 
 
+@lru_cache(maxsize=8192)
+def _url_cache_key(url: str) -> str:
+    """Build the URL result cache key; hot URLs skip rehashing."""
+    return f"url_cache:{hashlib.blake2b(url.encode(), digest_size=8).hexdigest()}"
+
+
 async def cache_url_result(url: str, result_data: dict[str, Any], ttl: int | None = None) -> bool:
     """Cache result by URL hash."""
-    import hashlib
-    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
     redis_instance = await get_redis()
     cache = RedisCache(redis_instance)
-    cache_key = f"url_cache:{url_hash}"
-    return await cache.set_json(cache_key, result_data, ttl or settings.CACHE_TTL)
+    return await cache.set_json(_url_cache_key(url), result_data, ttl or settings.CACHE_TTL)
+
+
+async def cache_scrape_results(results: list[tuple[str, str, dict[str, Any]]]) -> bool:
+    """
+    Cache a batch of job results under both their job and URL keys.
+
+    Args:
+        results: (job_id, url, result_data) for each finished job
+
+    Returns:
+        True if both batches were stored
+    """
+    redis_instance = await get_redis()
+    cache = RedisCache(redis_instance)
+    by_job = {f"job_result:{job_id}": data for job_id, _, data in results}
+    by_url = {_url_cache_key(url): data for _, url, data in results}
+    stored = await asyncio.gather(
+        cache.set_many_json(by_job, settings.RESULT_CACHE_TTL),
+        cache.set_many_json(by_url, settings.CACHE_TTL),
+    )
+    return all(stored)
 
 
 async def get_cached_url_result(url: str) -> dict[str, Any] | None:
     """Get cached result by URL hash."""
-    import hashlib
-    url_hash = hashlib.sha256(url.encode()).hexdigest()[:16]
     redis_instance = await get_redis()
     cache = RedisCache(redis_instance)
-    cache_key = f"url_cache:{url_hash}"
-    return await cache.get_json(cache_key)
+    return await cache.get_json(_url_cache_key(url))
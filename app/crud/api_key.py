@@ -0,0 +1,109 @@
+"""CRUD operations for ApiKey model."""
+from datetime import UTC, datetime
+from uuid import UUID
+
+from sqlalchemy import (
+    DateTime,
+    Integer,
+    bindparam,
+    column,
+    lambda_stmt,
+    update,
+    values,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.future import select
+
+from app.core.database_types import UUIDType
+from app.models.api_key import ApiKey, ApiKeySnapshot
+
+_api_keys = ApiKey.__table__
+
+
+class ApiKeyCRUD:
+    """CRUD operations for ApiKey model."""
+
+    async def get_by_hash(self, db: AsyncSession, key_hash: str) -> ApiKey | None:
+        """Get API key by its hash."""
+        result = await db.execute(
+            select(ApiKey).where(ApiKey.key_hash == key_hash)
+        )
+        return result.scalar_one_or_none()
+
+    async def get_snapshot_by_hash(
+        self, db: AsyncSession, key_hash: str
+    ) -> ApiKeySnapshot | None:
+        """
+        Get the columns needed for authentication by key hash.
+
+        Uses a cached Core statement so no ORM instance is built per request.
+        """
+        stmt = lambda_stmt(
+            lambda: select(
+                _api_keys.c.id,
+                _api_keys.c.rate_limit_per_minute,
+                _api_keys.c.rate_limit_per_hour,
+                _api_keys.c.is_active,
+                _api_keys.c.expires_at,
+            ).where(_api_keys.c.key_hash == key_hash)
+        )
+        row = (await db.execute(stmt)).one_or_none()
+        if row is None:
+            return None
+        return ApiKeySnapshot.from_model(row)
+
+    async def apply_usage(
+        self,
+        db: AsyncSession,
+        usage: dict[str, tuple[int, datetime | None]],
+    ) -> None:
+        """
+        Apply buffered usage counts to API keys.
+
+        Args:
+            usage: Dict mapping API key ID to (request count, last used timestamp)
+        """
+        if not usage:
+            return
+
+        now = datetime.now(UTC)
+        rows = [
+            (UUID(api_key_id), count, last_used or now)
+            for api_key_id, (count, last_used) in usage.items()
+        ]
+
+        if db.bind.dialect.name == "postgresql":
+            # Single UPDATE ... FROM (VALUES ...) for all buffered keys
+            usage_values = values(
+                column("key_id", UUIDType()),
+                column("request_count", Integer),
+                column("last_used", DateTime(timezone=True)),
+                name="usage",
+            ).data(rows)
+            await db.execute(
+                update(_api_keys)
+                .where(_api_keys.c.id == usage_values.c.key_id)
+                .values(
+                    total_requests=_api_keys.c.total_requests + usage_values.c.request_count,
+                    last_used_at=usage_values.c.last_used,
+                )
+            )
+        else:
+            # Other databases lack VALUES column aliases; use executemany
+            await db.execute(
+                update(_api_keys)
+                .where(_api_keys.c.id == bindparam("key_id"))
+                .values(
+                    total_requests=_api_keys.c.total_requests + bindparam("request_count"),
+                    last_used_at=bindparam("last_used"),
+                ),
+                [
+                    {"key_id": key_id, "request_count": count, "last_used": last_used}
+                    for key_id, count, last_used in rows
+                ],
+            )
+        await db.commit()
+
+
+# Create a global instance
+api_key_crud = ApiKeyCRUD()
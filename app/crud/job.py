@@ -1,9 +1,9 @@
 """CRUD operations for Job model."""
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from typing import Any
 from uuid import UUID
 
-from sqlalchemy import and_, desc, func, or_
+from sqlalchemy import and_, delete, desc, func, insert, lambda_stmt, or_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
 from sqlalchemy.orm import joinedload
@@ -43,10 +43,49 @@ class JobCRUD:
         await db.refresh(job)
         return job
 
+    async def bulk_create(
+        self,
+        db: AsyncSession,
+        jobs: list[dict[str, Any]],
+    ) -> list[Job]:
+        """
+        Create several jobs with a single INSERT ... RETURNING.
+
+        Args:
+            jobs: Column values for each job, using the same keys as create()
+
+        Returns:
+            Created jobs, in input order
+        """
+        rows = [
+            {
+                "url": job["url"],
+                "selector": job.get("selector"),
+                "options": job.get("options") or {},
+                "priority": job.get("priority", 0),
+                "scheduled_at": job.get("scheduled_at"),
+                "api_key_id": job.get("api_key_id"),
+                "max_retries": job.get("max_retries", 3),
+                "job_metadata": job.get("metadata") or {},
+            }
+            for job in jobs
+        ]
+        result = await db.scalars(insert(Job).returning(Job, sort_by_parameter_order=True), rows)
+        created = list(result.all())
+        await db.commit()
+        return created
+
     async def get(self, db: AsyncSession, job_id: UUID) -> Job | None:
-        """Get job by ID."""
+        """Get job by ID, without its result."""
+        result = await db.execute(lambda_stmt(lambda: select(Job).where(Job.id == job_id)))
+        return result.scalar_one_or_none()
+
+    async def get_with_result(self, db: AsyncSession, job_id: UUID) -> Job | None:
+        """Get job by ID with its result eagerly loaded."""
         result = await db.execute(
-            select(Job).where(Job.id == job_id).options(joinedload(Job.result))
+            lambda_stmt(
+                lambda: select(Job).where(Job.id == job_id).options(joinedload(Job.result))
+            )
         )
         return result.scalar_one_or_none()
 
@@ -59,12 +98,13 @@ class JobCRUD:
     ) -> list[Job]:
         """Get jobs by status."""
         result = await db.execute(
-            select(Job)
-            .where(Job.status == status)
-            .order_by(desc(Job.priority), Job.created_at)
-            .limit(limit)
-            .offset(offset)
-            .options(joinedload(Job.result))
+            lambda_stmt(
+                lambda: select(Job)
+                .where(Job.status == status)
+                .order_by(desc(Job.priority), Job.created_at)
+                .limit(limit)
+                .offset(offset)
+            )
         )
         return result.scalars().all()
 
@@ -74,18 +114,19 @@ class JobCRUD:
         limit: int = 100,
     ) -> list[Job]:
         """Get pending jobs ordered by priority and creation time."""
-        now = datetime.utcnow()
+        now = datetime.now(UTC)
         result = await db.execute(
-            select(Job)
-            .where(
-                and_(
-                    Job.status == JobStatus.PENDING,
-                    or_(Job.scheduled_at.is_(None), Job.scheduled_at <= now)
+            lambda_stmt(
+                lambda: select(Job)
+                .where(
+                    and_(
+                        Job.status == JobStatus.PENDING,
+                        or_(Job.scheduled_at.is_(None), Job.scheduled_at <= now)
+                    )
                 )
+                .order_by(desc(Job.priority), Job.created_at)
+                .limit(limit)
             )
-            .order_by(desc(Job.priority), Job.created_at)
-            .limit(limit)
-            .options(joinedload(Job.result))
         )
         return result.scalars().all()
 
@@ -96,16 +137,17 @@ class JobCRUD:
     ) -> list[Job]:
         """Get failed jobs that can be retried."""
         result = await db.execute(
-            select(Job)
-            .where(
-                and_(
-                    Job.status == JobStatus.FAILED,
-                    Job.retry_count < Job.max_retries
+            lambda_stmt(
+                lambda: select(Job)
+                .where(
+                    and_(
+                        Job.status == JobStatus.FAILED,
+                        Job.retry_count < Job.max_retries
+                    )
                 )
+                .order_by(desc(Job.priority), Job.created_at)
+                .limit(limit)
             )
-            .order_by(desc(Job.priority), Job.created_at)
-            .limit(limit)
-            .options(joinedload(Job.result))
         )
         return result.scalars().all()
 
@@ -117,23 +159,20 @@ class JobCRUD:
         error_message: str | None = None,
         started_at: datetime | None = None,
         completed_at: datetime | None = None,
+        execution_time_ms: int | None = None,
     ) -> Job | None:
-        """Update job status."""
-        job = await self.get(db, job_id)
-        if not job:
-            return None
-
-        job.status = status
+        """Update job status with a single UPDATE ... RETURNING."""
+        values: dict[str, Any] = {"status": status}
         if error_message is not None:
-            job.error_message = error_message
+            values["error_message"] = error_message
         if started_at is not None:
-            job.started_at = started_at
+            values["started_at"] = started_at
         if completed_at is not None:
-            job.completed_at = completed_at
+            values["completed_at"] = completed_at
+        if execution_time_ms is not None:
+            values["execution_time_ms"] = execution_time_ms
 
-        await db.commit()
-        await db.refresh(job)
-        return job
+        return await self._update_returning(db, job_id, values)
 
     async def increment_retry_count(
         self,
@@ -141,18 +180,36 @@ class JobCRUD:
         job_id: UUID,
     ) -> Job | None:
         """Increment retry count and set status to pending."""
-        job = await self.get(db, job_id)
-        if not job:
-            return None
-
-        job.retry_count += 1
-        job.status = JobStatus.PENDING
-        job.error_message = None
-        job.started_at = None
-        job.completed_at = None
+        return await self._update_returning(
+            db,
+            job_id,
+            {
+                # Incremented in the database so concurrent retries aren't lost
+                "retry_count": Job.retry_count + 1,
+                "status": JobStatus.PENDING,
+                "error_message": None,
+                "started_at": None,
+                "completed_at": None,
+                "execution_time_ms": None,
+            },
+        )
 
+    async def _update_returning(
+        self,
+        db: AsyncSession,
+        job_id: UUID,
+        values: dict[str, Any],
+    ) -> Job | None:
+        """Apply values to one job and return it, refreshing any loaded instance."""
+        result = await db.scalars(
+            update(Job)
+            .where(Job.id == job_id)
+            .values(**values)
+            .returning(Job)
+            .execution_options(synchronize_session=False, populate_existing=True)
+        )
+        job = result.one_or_none()
         await db.commit()
-        await db.refresh(job)
         return job
 
     async def get_recent_jobs(
@@ -162,57 +219,94 @@ class JobCRUD:
         api_key_id: UUID | None = None,
     ) -> list[Job]:
         """Get recent jobs."""
-        query = select(Job).order_by(desc(Job.created_at)).limit(limit)
+        query = lambda_stmt(lambda: select(Job).order_by(desc(Job.created_at)).limit(limit))
 
         if api_key_id:
-            query = query.where(Job.api_key_id == api_key_id)
+            query += lambda s: s.where(Job.api_key_id == api_key_id)
 
-        result = await db.execute(query.options(joinedload(Job.result)))
+        result = await db.execute(query)
         return result.scalars().all()
 
-    async def get_job_stats(
+    async def get_page(
         self,
         db: AsyncSession,
+        *,
+        limit: int,
+        offset: int = 0,
+        status: JobStatus | None = None,
         api_key_id: UUID | None = None,
-    ) -> dict[str, Any]:
-        """Get job statistics."""
-        base_query = select(func.count(Job.id))
-
+    ) -> tuple[list[Job], int]:
+        """
+        Get a page of jobs together with the total number of matching jobs.
+
+        The total comes from a COUNT(*) OVER () window on the same query, so
+        the page and its count take a single round-trip. Jobs filtered by
+        status are ordered like get_by_status, otherwise newest first.
+
+        Returns:
+            Tuple of (jobs, total)
+        """
+        filters = []
+        if status is not None:
+            filters.append(Job.status == status)
+            order_by = (desc(Job.priority), Job.created_at)
+        else:
+            order_by = (desc(Job.created_at),)
         if api_key_id:
-            base_query = base_query.where(Job.api_key_id == api_key_id)
+            filters.append(Job.api_key_id == api_key_id)
 
-        # Total jobs
-        total_result = await db.execute(base_query)
-        total = total_result.scalar()
-
-        # Jobs by status
-        stats = {"total": total}
+        result = await db.execute(
+            select(Job, func.count().over().label("total"))
+            .where(*filters)
+            .order_by(*order_by)
+            .limit(limit)
+            .offset(offset)
+            .options(joinedload(Job.result))
+        )
+        rows = result.all()
+        if rows:
+            return [row[0] for row in rows], rows[0][1]
 
-        for status in JobStatus:
-            status_query = base_query.where(Job.status == status)
-            result = await db.execute(status_query)
-            stats[status.value] = result.scalar()
+        # An empty page past the end carries no window count
+        if offset:
+            total = await db.scalar(select(func.count(Job.id)).where(*filters))
+            return [], total or 0
+        return [], 0
 
-        # Average execution time for completed jobs
-        execution_time_query = select(
-            func.avg(
-                func.extract("epoch", Job.completed_at - Job.started_at)
-            )
-        ).where(
-            and_(
-                Job.status == JobStatus.COMPLETED,
-                Job.started_at.is_not(None),
-                Job.completed_at.is_not(None)
-            )
+    async def get_job_stats(
+        self,
+        db: AsyncSession,
+        api_key_id: UUID | None = None,
+    ) -> dict[str, Any]:
+        """
+        Get job statistics.
+
+        Counts and average execution time come from a single grouped query.
+        """
+        jobs = Job.__table__
+        query = lambda_stmt(
+            lambda: select(
+                jobs.c.status,
+                func.count(),
+                func.avg(func.extract("epoch", jobs.c.completed_at - jobs.c.started_at)),
+            ).group_by(jobs.c.status)
         )
 
         if api_key_id:
-            execution_time_query = execution_time_query.where(Job.api_key_id == api_key_id)
+            query += lambda s: s.where(jobs.c.api_key_id == api_key_id)
 
-        result = await db.execute(execution_time_query)
-        avg_execution_time = result.scalar()
-        stats["average_execution_time"] = float(avg_execution_time) if avg_execution_time else 0
+        result = await db.execute(query)
+
+        stats = {status.value: 0 for status in JobStatus}
+        avg_execution_time = None
+        for status_value, count, avg_time in result.all():
+            job_status = JobStatus(status_value)
+            stats[job_status.value] = count
+            if job_status == JobStatus.COMPLETED:
+                avg_execution_time = avg_time
 
+        stats["total"] = sum(stats.values())
+        stats["average_execution_time"] = float(avg_execution_time) if avg_execution_time else 0
         return stats
 
     async def delete_old_jobs(
@@ -220,24 +314,31 @@ class JobCRUD:
         db: AsyncSession,
         older_than_days: int = 30,
         keep_failed: bool = True,
+        batch_size: int = 10000,
     ) -> int:
-        """Delete old jobs."""
-        cutoff_date = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0)
-        cutoff_date = cutoff_date - timedelta(days=older_than_days)
+        """
+        Delete old jobs.
 
-        query = select(Job).where(Job.created_at < cutoff_date)
+        Rows are removed with bulk DELETE statements in batches of
+        ``batch_size`` so large backlogs don't hold one long lock; results
+        are removed by the ON DELETE CASCADE foreign key.
+        """
+        cutoff_date = datetime.now(UTC) - timedelta(days=older_than_days)
 
+        jobs = Job.__table__
+        condition = jobs.c.created_at < cutoff_date
         if keep_failed:
-            query = query.where(Job.status != JobStatus.FAILED)
+            condition = and_(condition, jobs.c.status != JobStatus.FAILED)
 
-        result = await db.execute(query)
-        jobs_to_delete = result.scalars().all()
-
-        for job in jobs_to_delete:
-            await db.delete(job)
+        deleted = 0
+        while True:
+            batch = select(jobs.c.id).where(condition).limit(batch_size).scalar_subquery()
+            result = await db.execute(delete(jobs).where(jobs.c.id.in_(batch)))
+            await db.commit()
 
-        await db.commit()
-        return len(jobs_to_delete)
+            deleted += result.rowcount
+            if result.rowcount < batch_size:
+                return deleted
 
 
 # Create a global instance
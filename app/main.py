@@ -1,21 +1,38 @@
 """Main FastAPI application."""
+import asyncio
 import logging
 import time
-from contextlib import asynccontextmanager
+from collections.abc import Callable
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
+import orjson
 import structlog
-from fastapi import FastAPI, HTTPException, Request, status
+from fastapi import FastAPI, HTTPException, Request, Response, status
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.api.routes import admin, health, scraping
+from app.core.cache import close_redis as close_cache_redis
+from app.core.cache import get_redis_client
 from app.core.config import settings
-from app.core.database import close_db, init_db
+from app.core.database import close_db, init_db, run_pool_monitor
+from app.core.logs import orjson_dumps
 from app.core.redis import close_redis, init_redis
 from app.schemas.scraping import ErrorResponse
+from app.services.api_key_usage import flush_api_key_usage, run_api_key_usage_flusher
+from app.services.system_metrics import run_cpu_sampler
+
+# Log renderer and level are resolved once from settings
+_RENDERER = (
+    structlog.processors.JSONRenderer(serializer=orjson_dumps)
+    if settings.LOG_FORMAT == "json"
+    else structlog.dev.ConsoleRenderer()
+)
+_LEVEL = logging.getLevelName(settings.LOG_LEVEL.upper())
 
 # Configure structured logging
 structlog.configure(
@@ -24,11 +41,9 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer() if settings.LOG_FORMAT == "json" else structlog.dev.ConsoleRenderer(),
+        _RENDERER,
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(
-        logging.getLevelName(settings.LOG_LEVEL.upper())
-    ),
+    wrapper_class=structlog.make_filtering_bound_logger(_LEVEL),
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
@@ -51,8 +66,22 @@ async def lifespan(app: FastAPI):
 
         # Initialize Redis
         await init_redis()
+
+        # Create the pooled cache client now rather than on the first request
+        get_redis_client()
         logger.info("Redis initialized successfully")
 
+        # Start background flush of buffered API key usage
+        usage_flusher = asyncio.create_task(
+            run_api_key_usage_flusher(settings.API_KEY_USAGE_FLUSH_INTERVAL)
+        )
+
+        # Sample CPU usage in the background for admin endpoints
+        cpu_sampler = asyncio.create_task(run_cpu_sampler())
+
+        # Report pool high-water marks so pool sizing can be tuned
+        pool_monitor = asyncio.create_task(run_pool_monitor(settings.DB_POOL_LOG_INTERVAL))
+
         logger.info("Application startup completed successfully")
 
     except Exception as e:
@@ -65,12 +94,25 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Web Scraping API")
 
     try:
+        # Stop background tasks
+        for task in (usage_flusher, cpu_sampler, pool_monitor):
+            task.cancel()
+            with suppress(asyncio.CancelledError):
+                await task
+
+        # Write any usage buffered since the last flush
+        try:
+            await flush_api_key_usage()
+        except Exception as e:
+            logger.error("Failed to flush API key usage", error=str(e))
+
         # Close database connections
         await close_db()
         logger.info("Database connections closed")
 
         # Close Redis connections
         await close_redis()
+        await close_cache_redis()
         logger.info("Redis connections closed")
 
         logger.info("Application shutdown completed successfully")
@@ -89,6 +131,7 @@ app = FastAPI(
     docs_url=f"{settings.API_V1_STR}/docs" if (settings.DEBUG or settings.ENABLE_DOCS) else None,
     redoc_url=f"{settings.API_V1_STR}/redoc" if (settings.DEBUG or settings.ENABLE_DOCS) else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     openapi_tags=[
         {"name": "scraping", "description": "Web scraping operations - submit jobs, check status, and retrieve results"},
         {"name": "health", "description": "Health checks and system status monitoring"},
@@ -111,154 +154,160 @@ if not settings.DEBUG:
     app.add_middleware(TrustedHostMiddleware, allowed_hosts=["*"])
 
 
+# Probe and root paths polled by orchestrators; not worth a log line each
+_SKIP_LOG_PATHS = frozenset({
+    "/",
+    f"{settings.API_V1_STR}/health",
+    f"{settings.API_V1_STR}/health/ready",
+    f"{settings.API_V1_STR}/health/live",
+})
+
+
 # Request logging middleware
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """
     Log all incoming requests with timing information.
+
+    Health probes and the root path are passed straight through.
     """
-    start_time = time.time()
+    url = request.url
+    if url.path in _SKIP_LOG_PATHS:
+        return await call_next(request)
+
+    start = time.perf_counter()
 
     # Get client IP (accounting for proxies)
-    forwarded_for = request.headers.get("x-forwarded-for")
+    headers = request.headers
+    forwarded_for = headers.get("x-forwarded-for")
     if forwarded_for:
-        client_ip = forwarded_for.split(",")[0].strip()
+        client_ip = forwarded_for.partition(",")[0].strip()
     else:
         client_ip = request.client.host if request.client else "unknown"
 
     # Process request
     response = await call_next(request)
 
-    # Calculate processing time
-    process_time = time.time() - start_time
+    # Calculate processing time; perf_counter is monotonic, unlike wall-clock time
+    process_time = time.perf_counter() - start
 
     # Log request
     logger.info(
         "HTTP request processed",
         method=request.method,
-        url=str(request.url),
+        url=f"{url.path}?{url.query}" if url.query else url.path,
         client_ip=client_ip,
         status_code=response.status_code,
         process_time=round(process_time, 3),
-        user_agent=request.headers.get("user-agent", ""),
+        user_agent=headers.get("user-agent", ""),
     )
 
     # Add timing header
-    response.headers["X-Process-Time"] = str(process_time)
+    response.headers["X-Process-Time"] = f"{process_time:.3f}"
 
     return response
 
 
 # Exception handlers
+def _emit_error(
+    request: Request,
+    *,
+    status_code: int,
+    error: str,
+    message: str,
+    details: dict | None,
+    log_method: Callable[..., Any],
+    event: str,
+    log_fields: dict,
+    headers: dict[str, str] | None = None,
+) -> ORJSONResponse:
+    """
+    Log an error and render it as an ErrorResponse.
+
+    Handlers assemble the payload themselves, so it is built with
+    model_construct and serializer type warnings are off. Validation error
+    contexts can hold arbitrary objects such as the raised exception; those
+    fall back to their string form.
+    """
+    log_method(event, url=str(request.url), method=request.method, **log_fields)
+    error_response = ErrorResponse.model_construct(error=error, message=message, details=details)
+    return ORJSONResponse(
+        status_code=status_code,
+        content=error_response.model_dump(mode="json", fallback=str, warnings=False),
+        headers=headers,
+    )
+
+
 @app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException) -> JSONResponse:
+async def http_exception_handler(request: Request, exc: HTTPException) -> ORJSONResponse:
     """
     Handle HTTP exceptions with consistent error format.
     """
-    from fastapi.encoders import jsonable_encoder
-
-    logger.warning(
-        "HTTP exception occurred",
+    return _emit_error(
+        request,
         status_code=exc.status_code,
-        detail=exc.detail,
-        url=str(request.url),
-        method=request.method,
-    )
-
-    error_response = ErrorResponse(
         error="HTTPException",
         message=exc.detail,
-        details={"status_code": exc.status_code}
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=jsonable_encoder(error_response),
+        details={"status_code": exc.status_code},
+        log_method=logger.warning,
+        event="HTTP exception occurred",
+        log_fields={"status_code": exc.status_code, "detail": exc.detail},
         headers=exc.headers,
     )
 
 
 @app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError) -> JSONResponse:
+async def validation_exception_handler(request: Request, exc: RequestValidationError) -> ORJSONResponse:
     """
     Handle request validation errors with detailed information.
     """
-    from fastapi.encoders import jsonable_encoder
-
-    logger.warning(
-        "Request validation error",
-        errors=exc.errors(),
-        url=str(request.url),
-        method=request.method,
-    )
-
-    error_response = ErrorResponse(
+    errors = exc.errors()
+    return _emit_error(
+        request,
+        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
         error="ValidationError",
         message="Request validation failed",
         details={
-            "errors": exc.errors(),
+            "errors": errors,
             "body": exc.body if hasattr(exc, "body") else None,
-        }
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
-        content=jsonable_encoder(error_response),
+        },
+        log_method=logger.warning,
+        event="Request validation error",
+        log_fields={"errors": errors},
     )
 
 
 @app.exception_handler(StarletteHTTPException)
-async def starlette_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+async def starlette_exception_handler(request: Request, exc: StarletteHTTPException) -> ORJSONResponse:
     """
     Handle Starlette HTTP exceptions.
     """
-    from fastapi.encoders import jsonable_encoder
-
-    logger.error(
-        "Starlette HTTP exception",
+    return _emit_error(
+        request,
         status_code=exc.status_code,
-        detail=exc.detail,
-        url=str(request.url),
-        method=request.method,
-    )
-
-    error_response = ErrorResponse(
         error="StarletteHTTPException",
         message=exc.detail,
-        details={"status_code": exc.status_code}
-    )
-
-    return JSONResponse(
-        status_code=exc.status_code,
-        content=jsonable_encoder(error_response),
+        details={"status_code": exc.status_code},
+        log_method=logger.error,
+        event="Starlette HTTP exception",
+        log_fields={"status_code": exc.status_code, "detail": exc.detail},
     )
 
 
 @app.exception_handler(Exception)
-async def general_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+async def general_exception_handler(request: Request, exc: Exception) -> ORJSONResponse:
     """
     Handle unexpected exceptions.
     """
-    from fastapi.encoders import jsonable_encoder
-
-    logger.error(
-        "Unexpected exception occurred",
-        error=str(exc),
-        type=type(exc).__name__,
-        url=str(request.url),
-        method=request.method,
-        exc_info=True,
-    )
-
-    error_response = ErrorResponse(
+    return _emit_error(
+        request,
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
         error="InternalServerError",
         message="An unexpected error occurred" if not settings.DEBUG else str(exc),
-        details={"type": type(exc).__name__} if settings.DEBUG else None
-    )
-
-    return JSONResponse(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        content=jsonable_encoder(error_response),
+        details={"type": type(exc).__name__} if settings.DEBUG else None,
+        log_method=logger.error,
+        event="Unexpected exception occurred",
+        log_fields={"error": str(exc), "type": type(exc).__name__, "exc_info": True},
     )
 
 
@@ -349,6 +398,26 @@ def custom_openapi():
 # Override the default OpenAPI schema
 app.openapi = custom_openapi
 
+# Serialized schema, built on the first /openapi.json request
+_openapi_body: bytes | None = None
+
+
+async def openapi_json() -> Response:
+    """Serve the OpenAPI schema as bytes serialized once with orjson."""
+    global _openapi_body
+    if _openapi_body is None:
+        _openapi_body = orjson.dumps(app.openapi())
+    return Response(content=_openapi_body, media_type="application/json")
+
+
+# Replace FastAPI's built-in schema route, which re-serializes on every hit
+if app.openapi_url:
+    app.router.routes = [
+        route for route in app.router.routes
+        if getattr(route, "path", None) != app.openapi_url
+    ]
+    app.add_api_route(app.openapi_url, openapi_json, include_in_schema=False)
+
 
 if __name__ == "__main__":
     import uvicorn
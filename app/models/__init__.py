@@ -5,13 +5,14 @@ This module exports all database models and provides a centralized
 import point for the application.
 """
 
-from .api_key import ApiKey
+from .api_key import ApiKey, ApiKeySnapshot
 from .job import Job, JobStatus
 from .result import Result
 
 # Export all models
 __all__ = [
     "ApiKey",
+    "ApiKeySnapshot",
     "Job",
     "JobStatus",
     "Result",
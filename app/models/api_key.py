@@ -1,9 +1,12 @@
 """API Key model for authentication."""
-import hashlib
 import secrets
-from datetime import datetime
+from dataclasses import dataclass
+from datetime import UTC, datetime
+from functools import lru_cache
+from hashlib import sha256 as _sha256
+from hmac import compare_digest
 from typing import Any
-from uuid import uuid4
+from uuid import UUID, uuid4
 
 from sqlalchemy import Boolean, Column, DateTime, Index, Integer, String
 from sqlalchemy.sql import func
@@ -12,6 +15,19 @@ from app.core.database import Base
 from app.core.database_types import UUIDType
 
 
+def _is_past(moment: datetime) -> bool:
+    """Check whether a timestamp is in the past; naive values are read as UTC."""
+    if moment.tzinfo is None:
+        moment = moment.replace(tzinfo=UTC)
+    return datetime.now(UTC) > moment
+
+
+@lru_cache(maxsize=4096)
+def _hash_key(key: str) -> str:
+    """SHA-256 hex digest of a raw key; the same keys arrive on every request."""
+    return _sha256(key.encode()).hexdigest()
+
+
 class ApiKey(Base):
     """Model for API keys."""
 
@@ -55,17 +71,23 @@ class ApiKey(Base):
     @classmethod
     def generate_key(cls) -> str:
         """Generate a new API key."""
-        return f"sk-{secrets.token_urlsafe(32)}"
+        return "sk-" + secrets.token_urlsafe(32)
 
     @classmethod
     def hash_key(cls, key: str) -> str:
-        """Hash an API key for storage."""
-        return hashlib.sha256(key.encode()).hexdigest()
+        """
+        Hash an API key for storage.
+
+        Uses OpenSSL-backed SHA-256, which dispatches to the CPU's SHA
+        extensions where available; for key-sized inputs this is faster
+        than BLAKE3 and keeps stored hashes compatible.
+        """
+        return _hash_key(key)
 
     @classmethod
     def get_key_prefix(cls, key: str) -> str:
         """Get the prefix of an API key."""
-        return key[:8] if len(key) >= 8 else key
+        return key[:8]
 
     @classmethod
     def create_api_key(
@@ -101,15 +123,15 @@ class ApiKey(Base):
         return api_key, raw_key
 
     def verify_key(self, raw_key: str) -> bool:
-        """Verify a raw key against this API key."""
-        return self.key_hash == self.hash_key(raw_key)
+        """Verify a raw key against this API key, in constant time."""
+        return compare_digest(self.key_hash, self.hash_key(raw_key))
 
     @property
     def is_expired(self) -> bool:
         """Check if the API key is expired."""
         if not self.expires_at:
             return False
-        return datetime.utcnow() > self.expires_at
+        return _is_past(self.expires_at)
 
     @property
     def is_valid(self) -> bool:
@@ -118,7 +140,7 @@ class ApiKey(Base):
 
     def update_last_used(self) -> None:
         """Update the last used timestamp."""
-        self.last_used_at = datetime.utcnow()
+        self.last_used_at = datetime.now(UTC)
         self.total_requests += 1
 
     def to_dict(self) -> dict[str, Any]:
@@ -139,3 +161,64 @@ class ApiKey(Base):
             "is_expired": self.is_expired,
             "is_valid": self.is_valid,
         }
+
+
+@dataclass(frozen=True, slots=True)
+class ApiKeySnapshot:
+    """
+    Lightweight, cacheable view of an API key.
+
+    Holds only the fields needed to authenticate and rate limit a request,
+    so it can be stored in Redis and used without an ORM session.
+    """
+
+    id: UUID
+    rate_limit_per_minute: int
+    rate_limit_per_hour: int
+    is_active: bool
+    expires_at: datetime | None = None
+
+    @classmethod
+    def from_model(cls, api_key: Any) -> "ApiKeySnapshot":
+        """Build a snapshot from an ApiKey model instance or result row."""
+        return cls(
+            id=api_key.id,
+            rate_limit_per_minute=api_key.rate_limit_per_minute,
+            rate_limit_per_hour=api_key.rate_limit_per_hour,
+            is_active=api_key.is_active,
+            expires_at=api_key.expires_at,
+        )
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ApiKeySnapshot":
+        """Build a snapshot from its cached dictionary form."""
+        expires_at = data.get("expires_at")
+        return cls(
+            id=UUID(data["id"]),
+            rate_limit_per_minute=data["rate_limit_per_minute"],
+            rate_limit_per_hour=data["rate_limit_per_hour"],
+            is_active=data["is_active"],
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert snapshot to a JSON-serializable dictionary."""
+        return {
+            "id": str(self.id),
+            "rate_limit_per_minute": self.rate_limit_per_minute,
+            "rate_limit_per_hour": self.rate_limit_per_hour,
+            "is_active": self.is_active,
+            "expires_at": self.expires_at.isoformat() if self.expires_at else None,
+        }
+
+    @property
+    def is_expired(self) -> bool:
+        """Check if the API key is expired."""
+        if not self.expires_at:
+            return False
+        return _is_past(self.expires_at)
+
+    @property
+    def is_valid(self) -> bool:
+        """Check if the API key is valid (active and not expired)."""
+        return self.is_active and not self.is_expired
@@ -1,5 +1,6 @@
 """Job model for scraping tasks."""
 import enum
+from datetime import UTC, datetime
 from typing import Any
 from uuid import uuid4
 
@@ -28,20 +29,15 @@ class Job(Base):
     
     def __init__(self, **kwargs):
         """Initialize Job with proper defaults."""
-        # Set default values if not provided
-        if 'status' not in kwargs:
-            kwargs['status'] = JobStatus.PENDING
-        if 'retry_count' not in kwargs:
-            kwargs['retry_count'] = 0
-        if 'max_retries' not in kwargs:
-            kwargs['max_retries'] = 3
-        if 'priority' not in kwargs:
-            kwargs['priority'] = 0
-        if 'options' not in kwargs:
-            kwargs['options'] = {}
-        if 'job_metadata' not in kwargs:
-            kwargs['job_metadata'] = {}
-        
+        # Column defaults only apply at flush; set them up front so new
+        # instances are usable before they're persisted
+        kwargs.setdefault('status', JobStatus.PENDING)
+        kwargs.setdefault('retry_count', 0)
+        kwargs.setdefault('max_retries', 3)
+        kwargs.setdefault('priority', 0)
+        kwargs.setdefault('options', {})
+        kwargs.setdefault('job_metadata', {})
+
         super().__init__(**kwargs)
 
     # Primary key
@@ -57,6 +53,7 @@ class Job(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     started_at = Column(DateTime(timezone=True), nullable=True)
     completed_at = Column(DateTime(timezone=True), nullable=True)
+    execution_time_ms = Column(Integer, nullable=True)  # Set when the job finishes
 
     # Error handling and retries
     error_message = Column(Text, nullable=True)
@@ -79,6 +76,26 @@ class Job(Base):
         # Note: MD5 index for duplicate URL detection only works in PostgreSQL
         # For SQLite, we'll rely on the regular url index
         Index("ix_jobs_priority_status", "priority", "status"),
+        Index(
+            "ix_jobs_api_key_id_status",
+            "api_key_id",
+            "status",
+            postgresql_include=["started_at", "completed_at"],
+        ),
+        # Keeps the get_pending_jobs ORDER BY ... LIMIT an index range scan
+        Index(
+            "ix_jobs_pending_priority_created_at",
+            priority.desc(),
+            created_at,
+            postgresql_where=(status == JobStatus.PENDING),
+        ),
+        # Same for the get_failed_retryable_jobs scan over failed jobs
+        Index(
+            "ix_jobs_failed_priority_created_at",
+            priority.desc(),
+            created_at,
+            postgresql_where=(status == JobStatus.FAILED),
+        ),
     )
 
     # Relationships
@@ -91,11 +108,24 @@ class Job(Base):
 
     @property
     def execution_time(self) -> float | None:
-        """Calculate execution time in seconds."""
+        """Get execution time in seconds."""
+        if self.execution_time_ms is not None:
+            return self.execution_time_ms / 1000
         if self.started_at and self.completed_at:
             return (self.completed_at - self.started_at).total_seconds()
         return None
 
+    def elapsed_ms(self, until: datetime) -> int | None:
+        """Milliseconds from started_at to until; naive timestamps are read as UTC."""
+        started_at = self.started_at
+        if started_at is None:
+            return None
+        if started_at.tzinfo is None:
+            started_at = started_at.replace(tzinfo=UTC)
+        if until.tzinfo is None:
+            until = until.replace(tzinfo=UTC)
+        return int((until - started_at).total_seconds() * 1000)
+
     @property
     def is_terminal(self) -> bool:
         """Check if job is in a terminal state."""
@@ -110,21 +140,27 @@ class Job(Base):
         )
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert job to dictionary."""
+        """
+        Convert job to dictionary.
+
+        The id and timestamps are left as UUID and datetime objects; orjson
+        serializes them natively.
+        """
+        status = self.status
         return {
-            "id": str(self.id),
+            "id": self.id,
             "url": self.url,
             "selector": self.selector,
-            "options": self.options or {},
-            "status": self.status.value if self.status else None,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "started_at": self.started_at.isoformat() if self.started_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "options": self.options if self.options is not None else {},
+            "status": status.value if status else None,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "completed_at": self.completed_at,
             "error_message": self.error_message,
             "retry_count": self.retry_count if self.retry_count is not None else 0,
             "max_retries": self.max_retries if self.max_retries is not None else 3,
             "priority": self.priority if self.priority is not None else 0,
-            "scheduled_at": self.scheduled_at.isoformat() if self.scheduled_at else None,
+            "scheduled_at": self.scheduled_at,
             "execution_time": self.execution_time,
-            "metadata": self.job_metadata or {},
+            "metadata": self.job_metadata if self.job_metadata is not None else {},
         }
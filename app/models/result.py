@@ -3,11 +3,12 @@ from typing import Any
 from uuid import uuid4
 
 from sqlalchemy import Column, DateTime, ForeignKey, Index, Integer, String, Text
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.core.database import Base
-from app.core.database_types import JSONType, UUIDType
+from app.core.database_types import JSONType, UUIDType, json_array_length
 
 
 class Result(Base):
@@ -74,11 +75,17 @@ class Result(Base):
         data_preview = str(self.data)[:100] if self.data else "No data"
         return f"<Result(id={self.id}, job_id={self.job_id}, data='{data_preview}...')>"
 
-    @property
+    @hybrid_property
     def total_links(self) -> int:
         """Get total number of links extracted."""
         return len(self.links) if self.links else 0
 
+    @total_links.inplace.expression
+    @classmethod
+    def _total_links_expression(cls):
+        """Count links in SQL so list queries need not load the links column."""
+        return func.coalesce(json_array_length(cls.links), 0)
+
     @property
     def content_size_mb(self) -> float | None:
         """Get content size in megabytes."""
@@ -87,11 +94,16 @@ class Result(Base):
         return None
 
     def to_dict(self) -> dict[str, Any]:
-        """Convert result to dictionary."""
+        """
+        Convert result to dictionary.
+
+        The ids and timestamp are left as UUID and datetime objects; orjson
+        serializes them natively.
+        """
         return {
-            "id": str(self.id),
-            "job_id": str(self.job_id),
-            "data": self.data or {},
+            "id": self.id,
+            "job_id": self.job_id,
+            "data": self.data if self.data is not None else {},
             "content_type": self.content_type,
             "content_length": self.content_length,
             "size_bytes": self.size_bytes,
@@ -99,14 +111,14 @@ class Result(Base):
             "final_url": self.final_url,
             "screenshot_url": self.screenshot_url,
             "status_code": self.status_code,
-            "response_headers": self.response_headers or {},
-            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "response_headers": self.response_headers if self.response_headers is not None else {},
+            "created_at": self.created_at,
             "response_time": self.response_time,
             "page_load_time": self.page_load_time,
             "dom_ready_time": self.dom_ready_time,
             "text_content": self.text_content,
-            "links": self.links or [],
+            "links": self.links if self.links is not None else [],
             "total_links": self.total_links,
-            "browser_info": self.browser_info or {},
-            "metadata": self.result_metadata or {},
+            "browser_info": self.browser_info if self.browser_info is not None else {},
+            "metadata": self.result_metadata if self.result_metadata is not None else {},
         }
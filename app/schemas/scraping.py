@@ -1,10 +1,23 @@
 """Pydantic schemas for scraping API."""
+import re
 from datetime import datetime
 from enum import Enum
-from typing import Any
+from typing import Any, Literal
 from uuid import UUID
 
-from pydantic import BaseModel, Field, HttpUrl, validator
+from pydantic import BaseModel, Field, field_validator
+
+# Scheme, optional userinfo, host (name, IPv4 or bracketed IPv6), optional
+# port, then the rest of the URL; compiled once for every request
+_HOST_LABEL = r"[^\W_](?:[\w-]*[^\W_])?"
+_URL_RE = re.compile(
+    r"^(?P<scheme>https?)://"
+    r"(?P<userinfo>[^\s/?#@]+@)?"
+    rf"(?P<host>\[[0-9a-f:.]+\]|{_HOST_LABEL}(?:\.{_HOST_LABEL})*\.?)"
+    r"(?P<port>:\d{1,5})?"
+    r"(?P<rest>[/?#]\S*)?$",
+    re.IGNORECASE,
+)
 
 
 class ScrapingOptions(BaseModel):
@@ -21,27 +34,37 @@ class ScrapingOptions(BaseModel):
     timeout: int | None = Field(None, ge=5, le=120, description="Request timeout in seconds")
     follow_redirects: bool = Field(True, description="Follow HTTP redirects")
     ignore_https_errors: bool = Field(False, description="Ignore HTTPS certificate errors")
-    block_resources: list[str] = Field(default=[], description="Block resource types (image, stylesheet, font, etc.)")
+    block_resources: list[str] = Field(default_factory=list, description="Block resource types (image, stylesheet, font, etc.)")
 
 
 class ScrapeRequest(BaseModel):
     """Request schema for scraping job."""
-    url: HttpUrl = Field(..., description="URL to scrape")
+    url: str = Field(..., max_length=2048, description="URL to scrape")
     selector: str | None = Field(None, description="CSS selector for content extraction")
     options: ScrapingOptions | None = Field(default_factory=ScrapingOptions, description="Scraping options")
     priority: int = Field(0, ge=0, le=10, description="Job priority (0=normal, 10=highest)")
     scheduled_at: datetime | None = Field(None, description="When to execute the job (UTC)")
-    metadata: dict[str, Any] | None = Field(default={}, description="Additional metadata")
+    metadata: dict[str, Any] | None = Field(default_factory=dict, description="Additional metadata")
 
-    @validator("url")
+    @field_validator("url")
+    @classmethod
     def validate_url(cls, v):
-        """Validate URL format."""
-        url_str = str(v)
-        if not url_str.startswith(("http://", "https://")):
-            raise ValueError("URL must start with http:// or https://")
-        return v
-
-    @validator("selector")
+        """
+        Validate URL format.
+
+        Normalizes like HttpUrl did: scheme and host are lowercased and a
+        bare host gets a trailing slash.
+        """
+        match = _URL_RE.match(v)
+        if not match:
+            raise ValueError("URL must be an http:// or https:// URL with a valid host")
+        scheme, userinfo, host, port, rest = match.groups()
+        if not rest or not rest.startswith("/"):
+            rest = f"/{rest or ''}"
+        return f"{scheme.lower()}://{userinfo or ''}{host.lower()}{port or ''}{rest}"
+
+    @field_validator("selector")
+    @classmethod
     def validate_selector(cls, v):
         """Validate CSS selector format."""
         if v and len(v.strip()) == 0:
@@ -59,32 +82,40 @@ class JobStatusEnum(str, Enum):
     RETRYING = "retrying"
 
 
+# Response models validate status as a literal set; JobStatusEnum members still pass
+JobStatusValue = Literal["pending", "running", "completed", "failed", "cancelled", "retrying"]
+
+
 class ScrapeResponse(BaseModel):
     """Response schema for scraping job creation."""
     job_id: UUID = Field(..., description="Unique job identifier")
-    status: JobStatusEnum = Field(..., description="Current job status")
+    status: JobStatusValue = Field(..., description="Current job status")
     url: str = Field(..., description="URL being scraped")
     created_at: datetime = Field(..., description="Job creation timestamp")
     estimated_completion: datetime | None = Field(None, description="Estimated completion time")
     priority: int = Field(..., description="Job priority")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
+
+class BatchScrapeRequest(BaseModel):
+    """Request schema for submitting several scraping jobs at once."""
+    jobs: list[ScrapeRequest] = Field(..., min_length=1, max_length=100, description="Jobs to submit (1-100)")
+
+
+class BatchScrapeResponse(BaseModel):
+    """Response schema for batch scraping job creation."""
+    jobs: list[ScrapeResponse] = Field(..., description="Created jobs, in request order")
 
 
 class ScrapingResult(BaseModel):
     """Scraped data result."""
     content: str | None = Field(None, description="Extracted text content")
     html: str | None = Field(None, description="Raw HTML content")
-    links: list[str] | None = Field(default=[], description="Extracted links")
-    images: list[str] | None = Field(default=[], description="Extracted image URLs")
+    links: list[str] | None = Field(default_factory=list, description="Extracted links")
+    images: list[str] | None = Field(default_factory=list, description="Extracted image URLs")
     title: str | None = Field(None, description="Page title")
     meta_description: str | None = Field(None, description="Meta description")
-    headings: dict[str, list[str]] | None = Field(default={}, description="Page headings (h1, h2, etc.)")
-    forms: list[dict[str, Any]] | None = Field(default=[], description="Form elements found")
+    headings: dict[str, list[str]] | None = Field(default_factory=dict, description="Page headings (h1, h2, etc.)")
+    forms: list[dict[str, Any]] | None = Field(default_factory=list, description="Form elements found")
     screenshot_url: str | None = Field(None, description="Screenshot URL if requested")
 
 
@@ -98,14 +129,14 @@ class ScrapingMetadata(BaseModel):
     status_code: int | None = Field(None, description="HTTP status code")
     content_type: str | None = Field(None, description="Content-Type header")
     content_length: int | None = Field(None, description="Content length in bytes")
-    browser_info: dict[str, Any] | None = Field(default={}, description="Browser information")
+    browser_info: dict[str, Any] | None = Field(default_factory=dict, description="Browser information")
     timestamp: datetime = Field(..., description="Result timestamp")
 
 
 class JobDetailResponse(BaseModel):
     """Detailed job information response."""
     job_id: UUID = Field(..., description="Unique job identifier")
-    status: JobStatusEnum = Field(..., description="Current job status")
+    status: JobStatusValue = Field(..., description="Current job status")
     url: str = Field(..., description="URL being scraped")
     selector: str | None = Field(None, description="CSS selector used")
     options: ScrapingOptions | None = Field(None, description="Scraping options")
@@ -119,12 +150,6 @@ class JobDetailResponse(BaseModel):
     data: ScrapingResult | None = Field(None, description="Scraped data (if completed)")
     metadata: ScrapingMetadata | None = Field(None, description="Scraping metadata")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-            UUID: lambda v: str(v)
-        }
-
 
 class JobListResponse(BaseModel):
     """Response for job listing."""
@@ -154,11 +179,6 @@ class ErrorResponse(BaseModel):
     details: dict[str, Any] | None = Field(None, description="Additional error details")
     timestamp: datetime = Field(default_factory=datetime.utcnow, description="Error timestamp")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class HealthResponse(BaseModel):
     """Health check response."""
@@ -168,11 +188,6 @@ class HealthResponse(BaseModel):
     uptime: float = Field(..., description="Uptime in seconds")
     checks: dict[str, bool] = Field(..., description="Individual health checks")
 
-    class Config:
-        json_encoders = {
-            datetime: lambda v: v.isoformat()
-        }
-
 
 class QueueStatsResponse(BaseModel):
     """Queue statistics response."""
@@ -0,0 +1,50 @@
+"""
+API key usage write-behind service.
+
+Authenticated requests record usage in Redis; this module periodically
+drains those counters and applies them to the database in one batch.
+"""
+
+import asyncio
+import logging
+
+from app.core.cache import drain_api_key_usage, restore_api_key_usage
+from app.core.database import get_db_session
+from app.crud.api_key import api_key_crud
+
+logger = logging.getLogger(__name__)
+
+
+async def flush_api_key_usage() -> int:
+    """
+    Flush buffered API key usage from Redis to the database.
+
+    If the database write fails, the drained usage is put back in Redis
+    for the next flush.
+
+    Returns:
+        Number of API keys updated
+    """
+    usage = await drain_api_key_usage()
+    if not usage:
+        return 0
+
+    try:
+        async with get_db_session() as db:
+            await api_key_crud.apply_usage(db, usage)
+    except BaseException:
+        await restore_api_key_usage(usage)
+        raise
+
+    logger.debug(f"Flushed usage for {len(usage)} API keys")
+    return len(usage)
+
+
+async def run_api_key_usage_flusher(interval: float) -> None:
+    """Flush API key usage every ``interval`` seconds until cancelled."""
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            await flush_api_key_usage()
+        except Exception as e:
+            logger.error(f"Failed to flush API key usage: {e}")
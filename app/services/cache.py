@@ -5,29 +5,43 @@ This module provides high-level caching functionality for scraping results,
 including URL-based caching, cache invalidation, and cache statistics.
 """
 
-import json
+import asyncio
 import logging
+from collections import defaultdict
 from datetime import datetime, timedelta
 from typing import Any
 
+import msgpack
+
 from app.core.cache import (
     cache_delete,
     cache_get,
+    clear_local_scrape_cache,
+    generate_url_cache_key,
     get_cached_scrape_result,
     get_redis_client,
     set_cached_scrape_result,
+    unpack_scrape_result,
 )
 from app.core.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+_CACHE_TTL: int = get_settings().CACHE_TTL
+_STATS_FLUSH_INTERVAL = 1.0  # Seconds between cache statistics writes
+_STATS_TTL = 86400  # Expire stats after 24 hours
+_REPORTED_STAT_KEYS = tuple(
+    f"cache_stats:{stat_type}" for stat_type in ("hit", "miss", "store", "invalidate", "error")
+)
+
 
 class CacheService:
     """High-level caching service for scraping results."""
 
     def __init__(self):
-        self.settings = get_settings()
         self.redis = get_redis_client()
+        self._pending_stats: defaultdict[str, int] = defaultdict(int)
+        self._stats_flusher: asyncio.Task | None = None
 
     async def get_scrape_result(
         self,
@@ -51,15 +65,15 @@ class CacheService:
             if cached_result:
                 logger.debug(f"Cache hit for URL: {url}")
                 # Update access statistics
-                await self._update_cache_stats("hit")
+                self._update_cache_stats("hit")
                 return cached_result
             else:
                 logger.debug(f"Cache miss for URL: {url}")
-                await self._update_cache_stats("miss")
+                self._update_cache_stats("miss")
                 return None
         except Exception as e:
             logger.error(f"Error retrieving cached result: {e}")
-            await self._update_cache_stats("error")
+            self._update_cache_stats("error")
             return None
 
     async def store_scrape_result(
@@ -88,7 +102,7 @@ class CacheService:
             enriched_result = {
                 **result,
                 "cached_at": datetime.utcnow().isoformat(),
-                "cache_ttl": custom_ttl or self.settings.CACHE_TTL,
+                "cache_ttl": custom_ttl or _CACHE_TTL,
                 "cache_key_info": {
                     "url": url,
                     "selector": selector,
@@ -99,11 +113,11 @@ class CacheService:
             success = await set_cached_scrape_result(url, enriched_result, selector, options)
             if success:
                 logger.debug(f"Cached result for URL: {url}")
-                await self._update_cache_stats("store")
+                self._update_cache_stats("store")
             return success
         except Exception as e:
             logger.error(f"Error storing cached result: {e}")
-            await self._update_cache_stats("store_error")
+            self._update_cache_stats("store_error")
             return False
 
     async def invalidate_url(self, url: str, selector: str | None = None, options: dict | None = None) -> bool:
@@ -119,12 +133,11 @@ class CacheService:
             True if invalidated successfully
         """
         try:
-            from app.core.cache import generate_url_cache_key
             cache_key = generate_url_cache_key(url, selector, options)
             success = await cache_delete(cache_key)
             if success:
                 logger.info(f"Invalidated cache for URL: {url}")
-                await self._update_cache_stats("invalidate")
+                self._update_cache_stats("invalidate")
             return success
         except Exception as e:
             logger.error(f"Error invalidating cache for URL {url}: {e}")
@@ -143,14 +156,13 @@ class CacheService:
         try:
             # Get all cache keys matching pattern
             pattern = f"cache:url:*{url_pattern}*" if "*" not in url_pattern else f"cache:url:{url_pattern}"
-            keys = await self.redis.keys(pattern)
+            deleted_count = await self._unlink_matching(pattern)
+            clear_local_scrape_cache()
 
-            if keys:
-                deleted_count = await self.redis.delete(*keys)
+            if deleted_count:
                 logger.info(f"Invalidated {deleted_count} cache entries for pattern: {url_pattern}")
-                await self._update_cache_stats("bulk_invalidate", deleted_count)
-                return deleted_count
-            return 0
+                self._update_cache_stats("bulk_invalidate", deleted_count)
+            return deleted_count
         except Exception as e:
             logger.error(f"Error invalidating cache pattern {url_pattern}: {e}")
             return 0
@@ -168,7 +180,6 @@ class CacheService:
             Cache information or None if not cached
         """
         try:
-            from app.core.cache import generate_url_cache_key
             cache_key = generate_url_cache_key(url, selector, options)
 
             # Check if key exists and get TTL
@@ -181,9 +192,9 @@ class CacheService:
 
             if cached_data:
                 try:
-                    data = json.loads(cached_data)
+                    data = unpack_scrape_result(cached_data)
                     cached_at = data.get("cached_at")
-                    cache_ttl = data.get("cache_ttl", self.settings.CACHE_TTL)
+                    cache_ttl = data.get("cache_ttl", _CACHE_TTL)
 
                     return {
                         "cache_key": cache_key,
@@ -196,9 +207,9 @@ class CacheService:
                         ).isoformat() if cached_at else None,
                         "size_bytes": len(cached_data)
                     }
-                except json.JSONDecodeError:
-                    logger.warning(f"Invalid JSON in cache key {cache_key}")
-                    return {"cache_key": cache_key, "exists": True, "error": "Invalid JSON"}
+                except (msgpack.UnpackException, ValueError):
+                    logger.warning(f"Invalid MessagePack data in cache key {cache_key}")
+                    return {"cache_key": cache_key, "exists": True, "error": "Invalid data"}
 
             return {"cache_key": cache_key, "exists": False}
         except Exception as e:
@@ -213,22 +224,19 @@ class CacheService:
             Dictionary with cache statistics
         """
         try:
-            # Get all cache-related keys
-            cache_keys = await self.redis.keys("cache:*")
-            await self.redis.keys("cache_stats:*")
+            # Get all cache-related keys; SCAN doesn't block Redis like KEYS
+            cache_keys = [key async for key in self.redis.scan_iter(match="cache:*", count=1000)]
 
             # Basic counts
-            total_cached_items = len([k for k in cache_keys if k.startswith("cache:url:")])
+            total_cached_items = sum(1 for k in cache_keys if k.startswith(b"cache:url:"))
 
-            # Memory usage estimation
-            total_memory = 0
-            for key in cache_keys[:100]:  # Sample first 100 keys for performance
-                try:
-                    memory = await self.redis.memory_usage(key)
-                    if memory:
-                        total_memory += memory
-                except Exception:
-                    pass  # Key might have expired
+            # Memory usage estimation from the first 100 keys, in one round trip
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for key in cache_keys[:100]:
+                    pipe.memory_usage(key)
+                # Keys might have expired since the scan
+                memory_usages = await pipe.execute(raise_on_error=False)
+            total_memory = sum(m for m in memory_usages if isinstance(m, int))
 
             # Estimate total memory usage
             if cache_keys and total_cached_items > 0:
@@ -237,9 +245,11 @@ class CacheService:
             else:
                 estimated_total_memory = 0
 
-            # Get hit/miss statistics
-            hit_count = await self._get_cache_stat("hit") or 0
-            miss_count = await self._get_cache_stat("miss") or 0
+            # Get hit/miss statistics, including events not yet flushed
+            await self.flush_cache_stats()
+            hit_count, miss_count, store_count, invalidate_count, error_count = (
+                int(value) if value else 0 for value in await self.redis.mget(_REPORTED_STAT_KEYS)
+            )
             total_requests = hit_count + miss_count
             hit_rate = (hit_count / total_requests * 100) if total_requests > 0 else 0
 
@@ -251,9 +261,9 @@ class CacheService:
                 "total_cache_requests": total_requests,
                 "estimated_memory_bytes": int(estimated_total_memory),
                 "estimated_memory_mb": round(estimated_total_memory / 1024 / 1024, 2),
-                "store_count": await self._get_cache_stat("store") or 0,
-                "invalidate_count": await self._get_cache_stat("invalidate") or 0,
-                "error_count": await self._get_cache_stat("error") or 0,
+                "store_count": store_count,
+                "invalidate_count": invalidate_count,
+                "error_count": error_count,
                 "timestamp": datetime.utcnow().isoformat()
             }
         except Exception as e:
@@ -274,35 +284,61 @@ class CacheService:
             Number of keys deleted
         """
         try:
-            keys = await self.redis.keys(pattern)
-            if keys:
-                deleted_count = await self.redis.delete(*keys)
+            deleted_count = await self._unlink_matching(pattern)
+            clear_local_scrape_cache()
+            if deleted_count:
                 logger.info(f"Cleared {deleted_count} cache entries matching pattern: {pattern}")
-                await self._update_cache_stats("clear", deleted_count)
-                return deleted_count
-            return 0
+                self._update_cache_stats("clear", deleted_count)
+            return deleted_count
         except Exception as e:
             logger.error(f"Error clearing cache: {e}")
             return 0
 
-    async def _update_cache_stats(self, stat_type: str, count: int = 1) -> None:
-        """Update cache statistics counters."""
+    async def _unlink_matching(self, pattern: str, batch_size: int = 500) -> int:
+        """
+        Delete keys matching pattern without blocking Redis.
+
+        Keys are found with SCAN and removed in batches with UNLINK, which
+        frees memory in the background.
+        """
+        deleted_count = 0
+        batch = []
+        async for key in self.redis.scan_iter(match=pattern, count=batch_size):
+            batch.append(key)
+            if len(batch) >= batch_size:
+                deleted_count += await self.redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted_count += await self.redis.unlink(*batch)
+        return deleted_count
+
+    def _update_cache_stats(self, stat_type: str, count: int = 1) -> None:
+        """Count a cache event; counters are written to Redis in the background."""
+        self._pending_stats[stat_type] += count
+        if self._stats_flusher is None or self._stats_flusher.done():
+            self._stats_flusher = asyncio.create_task(self._run_stats_flusher())
+
+    async def _run_stats_flusher(self) -> None:
+        """Flush counted cache events every second until none are pending."""
+        while self._pending_stats:
+            await asyncio.sleep(_STATS_FLUSH_INTERVAL)
+            await self.flush_cache_stats()
+
+    async def flush_cache_stats(self) -> None:
+        """Write pending cache statistics counters with one pipeline."""
+        pending, self._pending_stats = self._pending_stats, defaultdict(int)
+        if not pending:
+            return
         try:
-            key = f"cache_stats:{stat_type}"
-            await self.redis.incr(key, count)
-            await self.redis.expire(key, 86400)  # Expire stats after 24 hours
+            async with self.redis.pipeline(transaction=False) as pipe:
+                for stat_type, count in pending.items():
+                    key = f"cache_stats:{stat_type}"
+                    pipe.incrby(key, count)
+                    pipe.expire(key, _STATS_TTL)
+                await pipe.execute()
         except Exception as e:
             logger.debug(f"Error updating cache stats: {e}")
 
-    async def _get_cache_stat(self, stat_type: str) -> int | None:
-        """Get cache statistic value."""
-        try:
-            key = f"cache_stats:{stat_type}"
-            value = await self.redis.get(key)
-            return int(value) if value else None
-        except Exception:
-            return None
-
 
 # Global cache service instance
 _cache_service: CacheService | None = None
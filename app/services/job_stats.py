@@ -0,0 +1,35 @@
+"""
+Job statistics service.
+
+Statistics are aggregated by the database and cached in Redis for a few
+seconds, so all API processes share one aggregation per API key.
+"""
+
+from typing import Any
+from uuid import UUID
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.cache import get_cached_job_stats, set_cached_job_stats
+from app.crud.job import job_crud
+
+
+async def load_job_stats(db: AsyncSession, api_key_id: UUID | None = None) -> dict[str, Any]:
+    """
+    Get job statistics, reading through the shared Redis cache.
+
+    Args:
+        db: Database session
+        api_key_id: Limit statistics to one API key's jobs
+
+    Returns:
+        Job counts per status, total and average execution time
+    """
+    cache_id = str(api_key_id) if api_key_id else None
+    stats = await get_cached_job_stats(cache_id)
+    if stats is not None:
+        return stats
+
+    stats = await job_crud.get_job_stats(db, api_key_id=api_key_id)
+    await set_cached_job_stats(cache_id, stats)
+    return stats
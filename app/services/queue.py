@@ -103,7 +103,7 @@ class JobQueue:
                 await asyncio.sleep(min(timeout, 1))
                 return None
 
-            job_id = jobs[0]
+            job_id = jobs[0].decode()
 
             # Atomically move job from queue to processing
             pipe = self.redis.pipeline()
@@ -238,7 +238,8 @@ class JobQueue:
                 return 0
 
             moved_count = 0
-            for job_id in retry_jobs:
+            for raw_job_id in retry_jobs:
+                job_id = raw_job_id.decode()
                 # Move from retry queue to main queue
                 pipe = self.redis.pipeline()
                 pipe.zrem(self.retry_key, job_id)
@@ -265,21 +266,29 @@ class JobQueue:
     async def get_queue_stats(self) -> dict[str, Any]:
         """Get queue statistics."""
         try:
+            # Sizes and the next job in a single round-trip
+            pipe = self.redis.pipeline(transaction=False)
+            pipe.zcard(self.queue_key)
+            pipe.scard(self.processing_key)
+            pipe.zcard(self.retry_key)
+            pipe.llen(self.dlq_key)
+            pipe.zrange(self.queue_key, 0, 0, withscores=True)
+            queue_size, processing_count, retry_queue_size, dlq_size, next_jobs = await pipe.execute()
+
             stats = {
-                "queue_size": await self.redis.zcard(self.queue_key),
-                "processing_count": await self.redis.scard(self.processing_key),
-                "retry_queue_size": await self.redis.zcard(self.retry_key),
-                "dead_letter_queue_size": await self.redis.llen(self.dlq_key),
+                "queue_size": queue_size,
+                "processing_count": processing_count,
+                "retry_queue_size": retry_queue_size,
+                "dead_letter_queue_size": dlq_size,
                 "timestamp": datetime.utcnow().isoformat()
             }
 
             # Get next job info
-            next_jobs = await self.redis.zrange(self.queue_key, 0, 0, withscores=True)
             if next_jobs:
                 job_id, score = next_jobs[0]
                 next_run_time = datetime.fromtimestamp(score)
                 stats["next_job"] = {
-                    "job_id": job_id,
+                    "job_id": job_id.decode(),
                     "scheduled_time": next_run_time.isoformat(),
                     "seconds_until_ready": max(0, (next_run_time - datetime.utcnow()).total_seconds())
                 }
@@ -302,7 +311,8 @@ class JobQueue:
             # Get all processing jobs
             processing_jobs = await self.redis.smembers(self.processing_key)
 
-            for job_id in processing_jobs:
+            for raw_job_id in processing_jobs:
+                job_id = raw_job_id.decode()
                 processing_start = await self.redis.get(f"processing:{job_id}")
                 if not processing_start:
                     # No processing timestamp, clean up
@@ -312,7 +322,7 @@ class JobQueue:
                     continue
 
                 # Check if processing time exceeded
-                start_time = datetime.fromisoformat(processing_start)
+                start_time = datetime.fromisoformat(processing_start.decode())
                 if (current_time - start_time).total_seconds() > max_processing_time:
                     # Job has been processing too long, clean up and retry
                     await self.redis.srem(self.processing_key, job_id)
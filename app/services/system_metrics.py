@@ -0,0 +1,65 @@
+"""
+Background system metrics sampling.
+
+CPU usage is sampled once per interval by a background task so request
+handlers can read the latest value without blocking on psutil. Memory
+and disk usage are cached for a few seconds between reads.
+"""
+
+import asyncio
+import logging
+
+import psutil
+
+from app.core.local_cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+_cpu_percent: float | None = None
+
+# Memory and disk usage change slowly; share readings between requests
+_system_cache = TTLCache(ttl=5)
+
+
+def get_cpu_percent() -> float:
+    """
+    Get the most recent CPU usage sample.
+
+    Falls back to a non-blocking psutil call if the sampler is not running.
+    """
+    if _cpu_percent is None:
+        return psutil.cpu_percent(interval=None)
+    return _cpu_percent
+
+
+def get_virtual_memory():
+    """Get system memory usage, cached for a few seconds."""
+    memory = _system_cache.get("memory")
+    if memory is None:
+        memory = psutil.virtual_memory()
+        _system_cache.set("memory", memory)
+    return memory
+
+
+def get_disk_usage(path: str = "/"):
+    """Get disk usage for ``path``, cached for a few seconds."""
+    key = ("disk", path)
+    disk = _system_cache.get(key)
+    if disk is None:
+        disk = psutil.disk_usage(path)
+        _system_cache.set(key, disk)
+    return disk
+
+
+async def run_cpu_sampler(interval: float = 1.0) -> None:
+    """Sample CPU usage every ``interval`` seconds until cancelled."""
+    global _cpu_percent
+
+    # Prime psutil so the first reading covers a full interval
+    psutil.cpu_percent(interval=None)
+    while True:
+        await asyncio.sleep(interval)
+        try:
+            _cpu_percent = psutil.cpu_percent(interval=None)
+        except Exception as e:
+            logger.error(f"Failed to sample CPU usage: {e}")
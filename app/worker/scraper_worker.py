@@ -4,7 +4,8 @@ import logging
 import os
 import random
 import time
-from datetime import datetime
+from datetime import UTC, datetime
+from functools import partial
 from typing import Any
 from uuid import UUID
 
@@ -15,11 +16,25 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.core.database import AsyncSessionLocal, init_db
-from app.core.redis import RedisQueue, cache_job_result, cache_url_result, get_redis
+from app.core.logs import orjson_dumps
+from app.core.redis import (
+    RedisQueue,
+    cache_scrape_results,
+    get_cached_url_result,
+    get_redis,
+)
 from app.crud.job import job_crud
 from app.models.job import Job, JobStatus
 from app.models.result import Result
 
+# Log renderer and level are resolved once from settings
+_RENDERER = (
+    structlog.processors.JSONRenderer(serializer=orjson_dumps)
+    if settings.LOG_FORMAT == "json"
+    else structlog.dev.ConsoleRenderer()
+)
+_LEVEL = logging.getLevelName(settings.LOG_LEVEL.upper())
+
 # Configure structured logging for worker
 structlog.configure(
     processors=[
@@ -27,17 +42,18 @@ structlog.configure(
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
         structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.JSONRenderer() if settings.LOG_FORMAT == "json" else structlog.dev.ConsoleRenderer(),
+        _RENDERER,
     ],
-    wrapper_class=structlog.make_filtering_bound_logger(
-        logging.getLevelName(settings.LOG_LEVEL.upper())
-    ),
+    wrapper_class=structlog.make_filtering_bound_logger(_LEVEL),
     logger_factory=structlog.stdlib.LoggerFactory(),
     cache_logger_on_first_use=True,
 )
 
 logger = structlog.get_logger(__name__)
 
+# Pick a rotating User-Agent from a snapshot of the configured list
+_random_user_agent = partial(random.choice, tuple(settings.USER_AGENTS))
+
 
 class ScraperWorker:
     """Playwright-based web scraper worker."""
@@ -113,12 +129,28 @@ class ScraperWorker:
 
         while self.running:
             try:
-                # Get next job from queue (blocking with timeout)
-                job_id = await self.queue.dequeue(timeout=10)
-
-                if job_id:
-                    logger.info("Processing job", job_id=job_id)
-                    await self.process_job(job_id)
+                # Get next batch of jobs from queue (blocking with timeout when empty)
+                job_ids = await self.queue.dequeue_batch(settings.WORKER_CONCURRENCY, timeout=10)
+
+                if job_ids:
+                    logger.info("Processing jobs", job_ids=job_ids)
+                    finished: list[tuple[str, str, dict[str, Any]]] = []
+                    outcomes = await asyncio.gather(
+                        *(self.process_job(job_id, finished) for job_id in job_ids),
+                        return_exceptions=True,
+                    )
+                    for job_id, outcome in zip(job_ids, outcomes, strict=True):
+                        if isinstance(outcome, BaseException):
+                            logger.error(
+                                "Unhandled error processing job",
+                                job_id=job_id,
+                                error=str(outcome),
+                                exc_info=outcome,
+                            )
+
+                    # Cache the whole batch's results in one pipelined write
+                    if finished:
+                        await cache_scrape_results(finished)
 
             except TimeoutError:
                 # No job available, continue
@@ -129,12 +161,18 @@ class ScraperWorker:
 
         logger.info("Worker main loop stopped")
 
-    async def process_job(self, job_id: str):
+    async def process_job(
+        self,
+        job_id: str,
+        finished: list[tuple[str, str, dict[str, Any]]] | None = None,
+    ):
         """
         Process a single scraping job.
 
         Args:
             job_id: UUID of the job to process
+            finished: If given, successful results are appended here for the
+                caller to cache in one batch; otherwise they're cached directly
         """
         async with AsyncSessionLocal() as db:
             try:
@@ -156,7 +194,7 @@ class ScraperWorker:
                     db,
                     job.id,
                     JobStatus.RUNNING,
-                    started_at=datetime.utcnow()
+                    started_at=datetime.now(UTC)
                 )
 
                 # Check for cached results first
@@ -164,16 +202,12 @@ class ScraperWorker:
                 if cached_result:
                     logger.info("Using cached result", job_id=job_id, url=job.url)
                     await self.save_result(db, job, cached_result, from_cache=True)
-                    await job_crud.update_status(
-                        db,
-                        job.id,
-                        JobStatus.COMPLETED,
-                        completed_at=datetime.utcnow()
-                    )
+                    await self._finish_job(db, job, JobStatus.COMPLETED)
                     await self.queue.complete_job(job_id)
                     return
 
                 # Perform scraping
+                scrape_started = time.monotonic()
                 result_data = await self.scrape_url(job)
 
                 if result_data:
@@ -181,27 +215,23 @@ class ScraperWorker:
                     await self.save_result(db, job, result_data)
 
                     # Cache result
-                    await cache_url_result(job.url, result_data)
-                    await cache_job_result(job_id, result_data)
+                    if finished is not None:
+                        finished.append((job_id, job.url, result_data))
+                    else:
+                        await cache_scrape_results([(job_id, job.url, result_data)])
 
                     # Update job status to completed
-                    await job_crud.update_status(
-                        db,
-                        job.id,
-                        JobStatus.COMPLETED,
-                        completed_at=datetime.utcnow()
-                    )
+                    await self._finish_job(db, job, JobStatus.COMPLETED)
+
+                    # Feed the execution time estimate used for new submissions
+                    await self.queue.record_execution_time(time.monotonic() - scrape_started)
 
                     logger.info("Job completed successfully", job_id=job_id)
 
                 else:
                     # Job failed
-                    await job_crud.update_status(
-                        db,
-                        job.id,
-                        JobStatus.FAILED,
-                        error_message="Scraping failed - no data extracted",
-                        completed_at=datetime.utcnow()
+                    await self._finish_job(
+                        db, job, JobStatus.FAILED, error_message="Scraping failed - no data extracted"
                     )
 
                     logger.error("Job failed - no data extracted", job_id=job_id)
@@ -210,28 +240,38 @@ class ScraperWorker:
 
             except Exception as e:
                 logger.error("Error processing job", job_id=job_id, error=str(e))
-
-                # Handle job retry logic
-                try:
-                    job = await job_crud.get(db, UUID(job_id))
-                    if job and job.can_retry:
-                        await job_crud.increment_retry_count(db, job.id)
-                        await self.queue.retry_job(job_id, priority=job.priority)
-                        logger.info("Job queued for retry", job_id=job_id, retry_count=job.retry_count + 1)
-                    else:
-                        await job_crud.update_status(
-                            db,
-                            UUID(job_id),
-                            JobStatus.FAILED,
-                            error_message=str(e),
-                            completed_at=datetime.utcnow()
-                        )
-                        await self.queue.complete_job(job_id)
-                        logger.error("Job failed permanently", job_id=job_id, error=str(e))
-
-                except Exception as retry_error:
-                    logger.error("Error handling job retry", job_id=job_id, error=str(retry_error))
-                    await self.queue.complete_job(job_id)
+                await self._handle_job_error(db, job_id, e)
+
+    async def _finish_job(self, db: AsyncSession, job: Job, status: JobStatus, **fields: Any):
+        """Move a job to a terminal status, recording when it finished and how long it ran."""
+        completed_at = datetime.now(UTC)
+        await job_crud.update_status(
+            db,
+            job.id,
+            status,
+            completed_at=completed_at,
+            execution_time_ms=job.elapsed_ms(completed_at),
+            **fields
+        )
+
+    async def _handle_job_error(self, db: AsyncSession, job_id: str, error: Exception):
+        """Requeue a job that raised while processing, or fail it once out of retries."""
+        try:
+            job = await job_crud.get(db, UUID(job_id))
+            if job and job.can_retry:
+                await job_crud.increment_retry_count(db, job.id)
+                await self.queue.retry_job(job_id, priority=job.priority)
+                logger.info("Job queued for retry", job_id=job_id, retry_count=job.retry_count + 1)
+                return
+
+            if job:
+                await self._finish_job(db, job, JobStatus.FAILED, error_message=str(error))
+            await self.queue.complete_job(job_id)
+            logger.error("Job failed permanently", job_id=job_id, error=str(error))
+
+        except Exception as retry_error:
+            logger.error("Error handling job retry", job_id=job_id, error=str(retry_error))
+            await self.queue.complete_job(job_id)
 
     async def scrape_url(self, job: Job) -> dict[str, Any] | None:
         """
@@ -255,7 +295,7 @@ class ScraperWorker:
                     "width": job.options.get("viewport_width", 1920),
                     "height": job.options.get("viewport_height", 1080)
                 },
-                user_agent=job.options.get("user_agent") or random.choice(settings.USER_AGENTS),
+                user_agent=job.options.get("user_agent") or _random_user_agent(),
                 ignore_https_errors=job.options.get("ignore_https_errors", False),
             )
 
@@ -434,7 +474,7 @@ class ScraperWorker:
                     "viewport": page.viewport_size,
                     "browser": settings.PLAYWRIGHT_BROWSER,
                 },
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": datetime.now(UTC).isoformat(),
             }
 
             logger.info(
@@ -485,7 +525,7 @@ class ScraperWorker:
             os.makedirs(screenshot_dir, exist_ok=True)
 
             # Generate screenshot filename
-            timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
+            timestamp = datetime.now(UTC).strftime("%Y%m%d_%H%M%S")
             filename = f"screenshot_{job_id}_{timestamp}.png"
             filepath = os.path.join(screenshot_dir, filename)
 
@@ -509,7 +549,6 @@ class ScraperWorker:
             Cached result data or None
         """
         try:
-            from app.core.redis import get_cached_url_result
             return await get_cached_url_result(url)
         except Exception as e:
             logger.warning("Error checking cache", url=url, error=str(e))
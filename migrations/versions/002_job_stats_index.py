@@ -0,0 +1,27 @@
+"""Add covering index for per-API-key job statistics
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-15 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '002'
+down_revision = '001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_api_key_id_status',
+        'jobs',
+        ['api_key_id', 'status'],
+        postgresql_include=['started_at', 'completed_at'],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_api_key_id_status', table_name='jobs')
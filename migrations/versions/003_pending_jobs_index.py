@@ -0,0 +1,28 @@
+"""Add partial index for claiming pending jobs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-15 14:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_pending_priority_created_at',
+        'jobs',
+        [sa.text('priority DESC'), 'created_at'],
+        postgresql_where=sa.text("status = 'pending'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_pending_priority_created_at', table_name='jobs')
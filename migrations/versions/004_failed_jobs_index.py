@@ -0,0 +1,28 @@
+"""Add partial index for retryable failed jobs
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-15 16:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_jobs_failed_priority_created_at',
+        'jobs',
+        [sa.text('priority DESC'), 'created_at'],
+        postgresql_where=sa.text("status = 'failed'"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_jobs_failed_priority_created_at', table_name='jobs')
@@ -0,0 +1,23 @@
+"""Store job execution time at completion
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-15 17:00:00.000000
+
+"""
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('jobs', sa.Column('execution_time_ms', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('jobs', 'execution_time_ms')
@@ -126,6 +126,11 @@ def mock_redis():
     mock_redis.zremrangebyscore = AsyncMock(return_value=0)
     mock_redis.zrange = AsyncMock(return_value=[])
     mock_redis.close = AsyncMock()
+
+    # Pipelines queue commands synchronously and send them on execute()
+    mock_pipeline = MagicMock()
+    mock_pipeline.execute = AsyncMock(return_value=[1, 1, None])
+    mock_redis.pipeline = MagicMock(return_value=mock_pipeline)
     mock_redis.info = AsyncMock(return_value={
         "redis_version": "6.0.0",
         "connected_clients": 1,
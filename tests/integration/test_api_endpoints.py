@@ -1,9 +1,16 @@
 """Integration tests for API endpoints."""
 
+import asyncio
+import json
+from datetime import datetime
+from unittest.mock import AsyncMock
+
 import pytest
 from httpx import AsyncClient
-from unittest.mock import AsyncMock
+from sqlalchemy import event
 
+from app.models.job import Job, JobStatus
+from app.models.result import Result
 from tests.fixtures.factories import create_scrape_request
 
 
@@ -26,6 +33,46 @@ class TestScrapingEndpoints:
         assert data["status"] == "pending"
         assert data["url"] == sample_scrape_request["url"]
     
+    @pytest.mark.asyncio
+    async def test_submit_scrape_job_coalesces_concurrent_duplicates(self, client: AsyncClient, sample_scrape_request):
+        """Test identical concurrent submissions share one job."""
+        first, second = await asyncio.gather(
+            client.post("/api/v1/scrape", json=sample_scrape_request),
+            client.post("/api/v1/scrape", json=sample_scrape_request),
+        )
+
+        assert first.status_code == second.status_code == 202
+        assert first.json()["job_id"] == second.json()["job_id"]
+
+        # Once the first submission finished, a new one creates a new job
+        third = await client.post("/api/v1/scrape", json=sample_scrape_request)
+        assert third.json()["job_id"] != first.json()["job_id"]
+
+    @pytest.mark.asyncio
+    async def test_submit_scrape_jobs_batch(self, client: AsyncClient, sample_scrape_request):
+        """Test submitting several scraping jobs in one request."""
+        second_request = {**sample_scrape_request, "url": "https://example.com/", "priority": 5}
+        response = await client.post(
+            "/api/v1/scrape/batch",
+            json={"jobs": [sample_scrape_request, second_request]},
+        )
+
+        assert response.status_code == 202
+        jobs = response.json()["jobs"]
+
+        assert len(jobs) == 2
+        assert [job["url"] for job in jobs] == [sample_scrape_request["url"], second_request["url"]]
+        assert [job["priority"] for job in jobs] == [0, 5]
+        assert all(job["status"] == "pending" for job in jobs)
+        assert jobs[0]["job_id"] != jobs[1]["job_id"]
+
+    @pytest.mark.asyncio
+    async def test_submit_scrape_jobs_batch_empty(self, client: AsyncClient):
+        """Test batch submission requires at least one job."""
+        response = await client.post("/api/v1/scrape/batch", json={"jobs": []})
+
+        assert response.status_code == 422
+
     @pytest.mark.asyncio
     async def test_submit_scrape_job_invalid_url(self, client: AsyncClient):
         """Test scraping job submission with invalid URL."""
@@ -91,6 +138,41 @@ class TestScrapingEndpoints:
         
         assert response.status_code == 404
     
+    @pytest.mark.asyncio
+    async def test_get_finished_job_details_etag(self, client: AsyncClient, db_session, mock_redis):
+        """Test finished jobs are cached and honour If-None-Match."""
+        job = Job(
+            url="https://example.com",
+            status=JobStatus.FAILED,
+            completed_at=datetime(2024, 1, 1, 12, 0, 0),
+            error_message="boom",
+        )
+        db_session.add(job)
+        await db_session.commit()
+
+        response = await client.get(f"/api/v1/scrape/{job.id}")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "failed"
+        etag = response.headers["etag"]
+        assert etag.startswith('W/"')
+        key, _ttl, value = mock_redis.setex.call_args.args
+        assert key == f"cache:job:{job.id}"
+        assert json.loads(value)["etag"] == etag
+
+        # Served from the cache without touching the database
+        mock_redis.get.return_value = value
+        await db_session.delete(job)
+        await db_session.commit()
+
+        response = await client.get(f"/api/v1/scrape/{job.id}")
+        assert response.status_code == 200
+        assert response.json()["error_message"] == "boom"
+
+        response = await client.get(f"/api/v1/scrape/{job.id}", headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
     @pytest.mark.asyncio
     async def test_get_job_details_invalid_uuid(self, client: AsyncClient):
         """Test getting job details with invalid UUID format."""
@@ -127,6 +209,62 @@ class TestScrapingEndpoints:
         assert data["page"] == 2
         assert data["per_page"] == 5
     
+    @pytest.mark.asyncio
+    async def test_list_jobs_status_filter(self, client: AsyncClient):
+        """Test status filters are matched case-insensitively and validated."""
+        response = await client.get("/api/v1/results?status_filter=COMPLETED")
+        assert response.status_code == 200
+
+        response = await client.get("/api/v1/results?status_filter=bogus")
+        assert response.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_list_jobs_total_counts_all_matching_jobs(self, client: AsyncClient, db_session):
+        """Test pagination reports the total across pages, not the page length."""
+        for i in range(7):
+            db_session.add(Job(url=f"https://example.com/{i}"))
+        await db_session.commit()
+
+        response = await client.get("/api/v1/results?page=2&per_page=5")
+        data = response.json()
+        assert len(data["jobs"]) == 2
+        assert data["total"] == 7
+        assert data["pages"] == 2
+
+        response = await client.get("/api/v1/results?page=3&per_page=5")
+        data = response.json()
+        assert data["jobs"] == []
+        assert data["total"] == 7
+
+    @pytest.mark.asyncio
+    async def test_list_jobs_loads_results_without_extra_queries(self, client: AsyncClient, db_session):
+        """Test listing completed jobs does not issue a query per job."""
+
+        for i in range(5):
+            job = Job(url=f"https://example.com/{i}", status=JobStatus.COMPLETED)
+            job.result = Result(data={"title": f"Page {i}"}, result_metadata={})
+            db_session.add(job)
+        await db_session.commit()
+
+        statements = []
+
+        def count_selects(_conn, _cursor, statement, *_args):
+            if statement.lstrip().upper().startswith("SELECT"):
+                statements.append(statement)
+
+        sync_engine = db_session.bind.engine.sync_engine
+        event.listen(sync_engine, "before_cursor_execute", count_selects)
+        try:
+            response = await client.get("/api/v1/results")
+        finally:
+            event.remove(sync_engine, "before_cursor_execute", count_selects)
+
+        assert response.status_code == 200
+        jobs = response.json()["jobs"]
+        assert len(jobs) == 5
+        assert all(job["data"] is not None for job in jobs)
+        assert len(statements) == 1
+
     @pytest.mark.asyncio 
     async def test_get_job_stats(self, client: AsyncClient):
         """Test getting job statistics."""
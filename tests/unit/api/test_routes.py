@@ -0,0 +1,17 @@
+"""Unit tests for API route registration."""
+
+from app.api.routes import admin, health, scraping
+
+
+class TestRouteRegistration:
+    """Test cases for router definitions."""
+
+    def test_no_duplicate_routes(self):
+        """Test each router registers every path and method only once."""
+        for router in (health.router, admin.router, scraping.router):
+            routes = [
+                (route.path, method)
+                for route in router.routes
+                for method in route.methods
+            ]
+            assert len(routes) == len(set(routes))
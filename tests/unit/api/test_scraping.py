@@ -0,0 +1,70 @@
+"""Unit tests for scraping route helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.api.routes import scraping
+from app.schemas.scraping import ScrapeRequest
+
+
+class TestSubmitJobOnce:
+    """Test cases for coalesced job submission."""
+
+    @pytest.mark.asyncio
+    async def test_waiter_survives_cancelled_first_request(self):
+        """Test a waiting request still gets a job when the first one is cancelled."""
+        request = ScrapeRequest(url="https://example.com")
+        first_started = asyncio.Event()
+        response = MagicMock()
+
+        async def submit_jobs(_db, _requests, _api_key):
+            if not first_started.is_set():
+                first_started.set()
+                await asyncio.Event().wait()  # Blocks until cancelled
+            return [response]
+
+        with patch.object(scraping, "_submit_jobs", AsyncMock(side_effect=submit_jobs)) as mock_submit:
+            first = asyncio.create_task(scraping._submit_job_once(MagicMock(), request, None))
+            await first_started.wait()
+            second = asyncio.create_task(scraping._submit_job_once(MagicMock(), request, None))
+            await asyncio.sleep(0)
+
+            first.cancel()
+
+            assert await second is response
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            assert mock_submit.await_count == 2
+            assert not scraping._inflight_submissions
+
+    @pytest.mark.asyncio
+    async def test_different_priority_or_metadata_is_not_coalesced(self):
+        """Test concurrent requests only share a job when all job fields match."""
+        release = asyncio.Event()
+
+        async def submit_jobs(_db, requests, _api_key):
+            await release.wait()
+            return [MagicMock(priority=requests[0].priority, metadata=requests[0].metadata)]
+
+        requests = [
+            ScrapeRequest(url="https://example.com", priority=1),
+            ScrapeRequest(url="https://example.com", priority=5),
+            ScrapeRequest(url="https://example.com", priority=5, metadata={"client": "b"}),
+            ScrapeRequest(url="https://example.com", priority=5, metadata={"client": "b"}),
+        ]
+
+        with patch.object(scraping, "_submit_jobs", AsyncMock(side_effect=submit_jobs)) as mock_submit:
+            tasks = [
+                asyncio.create_task(scraping._submit_job_once(MagicMock(), request, None))
+                for request in requests
+            ]
+            await asyncio.sleep(0)
+            release.set()
+            responses = await asyncio.gather(*tasks)
+
+        assert mock_submit.await_count == 3
+        assert [response.priority for response in responses] == [1, 5, 5, 5]
+        assert responses[2] is responses[3]
+        assert responses[1].metadata == {}
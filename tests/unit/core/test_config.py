@@ -36,7 +36,7 @@ class TestSettings:
         # Redis defaults
         assert settings.REDIS_URL == "redis://redis:6379/0"
         assert settings.REDIS_POOL_SIZE == 10
-        assert settings.REDIS_POOL_MAX_CONNECTIONS == 20
+        assert settings.REDIS_POOL_MAX_CONNECTIONS == 100
         
         # Scraping defaults
         assert settings.SCRAPE_TIMEOUT == 30
@@ -246,18 +246,18 @@ class TestGetSettings:
         assert hasattr(settings, 'DATABASE_URL')
         assert hasattr(settings, 'REDIS_URL')
     
-    @patch('app.core.config._settings', None)
-    def test_get_settings_creates_new_instance_when_none(self):
-        """Test that get_settings creates a new instance when global is None."""
-        # Clear the global settings
-        import app.core.config
-        app.core.config._settings = None
-        
-        settings = get_settings()
-        
-        assert isinstance(settings, Settings)
-        assert app.core.config._settings is not None
-        assert app.core.config._settings is settings
+    def test_get_settings_creates_new_instance_after_cache_clear(self):
+        """Test that get_settings creates a new instance when the cache is cleared."""
+        original = get_settings()
+        get_settings.cache_clear()
+        try:
+            settings = get_settings()
+
+            assert isinstance(settings, Settings)
+            assert settings is not original
+            assert get_settings() is settings
+        finally:
+            get_settings.cache_clear()
     
     def test_settings_field_descriptions(self):
         """Test that settings fields have proper descriptions."""
@@ -0,0 +1,96 @@
+"""Unit tests for in-process TTL cache."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from app.core.local_cache import TTLCache, cached
+
+
+class TestTTLCache:
+    """Test cases for TTLCache class."""
+
+    def test_get_set(self):
+        """Test cached values are returned until they expire."""
+        cache = TTLCache(ttl=10)
+        cache.set("a", 1)
+
+        assert cache.get("a") == 1
+        assert cache.get("missing", "default") == "default"
+
+    def test_expiry(self):
+        """Test expired entries are dropped."""
+        cache = TTLCache(ttl=10)
+        with patch("app.core.local_cache.time.monotonic", return_value=100.0):
+            cache.set("a", 1)
+        with patch("app.core.local_cache.time.monotonic", return_value=111.0):
+            assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_maxsize_evicts_least_recently_used(self):
+        """Test the least recently used entry is evicted when full."""
+        cache = TTLCache(ttl=10, maxsize=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        assert cache.get("a") == 1
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+
+
+class TestCachedDecorator:
+    """Test cases for cached decorator."""
+
+    @pytest.mark.asyncio
+    async def test_caches_per_key(self):
+        """Test results are reused per cache key."""
+        calls = []
+
+        @cached(ttl=10, key=lambda value: value)
+        async def compute(value):
+            calls.append(value)
+            return value * 2
+
+        assert await compute(1) == 2
+        assert await compute(1) == 2
+        assert await compute(2) == 4
+        assert calls == [1, 2]
+
+        compute.cache.clear()
+        await compute(1)
+        assert calls == [1, 2, 1]
+
+    @pytest.mark.asyncio
+    async def test_exceptions_not_cached(self):
+        """Test failed calls are retried on the next invocation."""
+        calls = []
+
+        @cached(ttl=10)
+        async def flaky():
+            calls.append(1)
+            if len(calls) == 1:
+                raise RuntimeError("boom")
+            return "ok"
+
+        with pytest.raises(RuntimeError):
+            await flaky()
+        assert await flaky() == "ok"
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_single_call(self):
+        """Test concurrent callers share one underlying call."""
+        calls = []
+
+        @cached(ttl=10)
+        async def slow():
+            calls.append(1)
+            await asyncio.sleep(0.01)
+            return "value"
+
+        results = await asyncio.gather(*(slow() for _ in range(5)))
+        assert results == ["value"] * 5
+        assert len(calls) == 1
@@ -0,0 +1,80 @@
+"""Unit tests for Redis helpers."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from app.core.redis import AutoPipeline
+
+
+class TestAutoPipeline:
+    """Test cases for AutoPipeline class."""
+
+    @pytest.mark.asyncio
+    async def test_batches_commands_from_one_tick(self):
+        """Test concurrent commands are sent as a single pipeline."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"1", 5])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        auto = AutoPipeline(client)
+        results = await asyncio.gather(auto.get("a"), auto.zcard("q"))
+
+        assert results == [b"1", 5]
+        client.pipeline.assert_called_once_with(transaction=False)
+        pipe.get.assert_called_once_with("a")
+        pipe.zcard.assert_called_once_with("q")
+
+    @pytest.mark.asyncio
+    async def test_single_command_skips_pipeline(self):
+        """Test a lone command is sent directly."""
+        client = MagicMock()
+        client.get = AsyncMock(return_value=b"1")
+
+        auto = AutoPipeline(client)
+
+        assert await auto.get("a") == b"1"
+        client.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_only_their_caller(self):
+        """Test a failed command raises for its caller only."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"1", ValueError("wrong type")])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        auto = AutoPipeline(client)
+        ok, failed = await asyncio.gather(auto.get("a"), auto.hgetall("a"), return_exceptions=True)
+
+        assert ok == b"1"
+        assert isinstance(failed, ValueError)
+
+    @pytest.mark.asyncio
+    async def test_other_attributes_pass_through(self):
+        """Test commands outside the batched set go straight to the client."""
+        client = MagicMock()
+        client.bzpopmin = AsyncMock(return_value=None)
+
+        auto = AutoPipeline(client)
+
+        assert await auto.bzpopmin("q", timeout=1) is None
+        client.bzpopmin.assert_awaited_once_with("q", timeout=1)
+
+    @pytest.mark.asyncio
+    async def test_short_pipeline_reply_fails_every_caller(self):
+        """Test a reply shorter than the batch fails all callers instead of hanging."""
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[b"1"])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        auto = AutoPipeline(client)
+        results = await asyncio.wait_for(
+            asyncio.gather(auto.get("a"), auto.get("b"), return_exceptions=True),
+            timeout=1,
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
@@ -81,7 +81,19 @@ class TestJobModel:
         job.completed_at = end_time
         
         assert job.execution_time == 5.0
-    
+
+    def test_execution_time_prefers_stored_value(self):
+        """Test execution time stored at completion is used when present."""
+        start_time = datetime.utcnow()
+        job = Job(url="https://example.com", started_at=start_time)
+
+        assert job.elapsed_ms(start_time + timedelta(seconds=2.5)) == 2500
+
+        job.completed_at = start_time + timedelta(seconds=5)
+        job.execution_time_ms = 4200
+
+        assert job.execution_time == 4.2
+
     def test_is_terminal_property(self):
         """Test is_terminal property for different job statuses."""
         job = Job(url="https://example.com")
@@ -159,7 +171,7 @@ class TestJobModel:
         }
         
         assert set(job_dict.keys()) == expected_keys
-        assert job_dict["id"] == str(job_id)
+        assert job_dict["id"] == job_id
         assert job_dict["url"] == "https://example.com"
         assert job_dict["selector"] == ".content"
         assert job_dict["options"] == {"screenshot": True}
@@ -2,12 +2,13 @@
 
 import pytest
 from datetime import datetime
+from typing import get_args
 from uuid import uuid4
 from pydantic import ValidationError
 
 from app.schemas.scraping import (
     ScrapingOptions, ScrapeRequest, ScrapingResult, 
-    ScrapingMetadata, JobDetailResponse, JobStatusEnum,
+    ScrapingMetadata, JobDetailResponse, JobStatusEnum, JobStatusValue,
     ScrapeResponse, JobListResponse, JobStatsResponse,
     ErrorResponse, HealthResponse, QueueStatsResponse,
     AdminStatsResponse
@@ -158,7 +159,24 @@ class TestScrapeRequest:
             ScrapeRequest(url="ftp://example.com")
         with pytest.raises(ValidationError):
             ScrapeRequest(url="javascript:alert('test')")
-    
+
+    def test_scrape_request_url_normalization(self):
+        """Test scheme and host are lowercased like HttpUrl did."""
+        request = ScrapeRequest(url="HTTPS://Example.com/a")
+        assert request.url == "https://example.com/a"
+
+        request = ScrapeRequest(url="http://127.0.0.1:8080?q=1")
+        assert request.url == "http://127.0.0.1:8080/?q=1"
+
+        request = ScrapeRequest(url="http://[::1]/path")
+        assert request.url == "http://[::1]/path"
+
+    @pytest.mark.parametrize("url", ["http://:::", "http://", "http:///path", "http://-a.com", "http://a..com"])
+    def test_scrape_request_rejects_invalid_hosts(self, url):
+        """Test URLs without a valid host are rejected."""
+        with pytest.raises(ValidationError):
+            ScrapeRequest(url=url)
+
     def test_scrape_request_selector_validation(self):
         """Test CSS selector validation."""
         # Valid selectors
@@ -329,6 +347,10 @@ class TestJobStatusEnum:
         assert status == "pending"
         assert str(status) == "JobStatusEnum.PENDING"
 
+    def test_job_status_value_matches_enum(self):
+        """Test the response status literal covers exactly the enum values."""
+        assert set(get_args(JobStatusValue)) == {status.value for status in JobStatusEnum}
+
 
 class TestScrapeResponse:
     """Test cases for ScrapeResponse schema."""
@@ -0,0 +1,59 @@
+"""Unit tests for the API key usage flusher."""
+
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from app.core.cache import (
+    API_KEY_USAGE_COUNTS_KEY,
+    API_KEY_USAGE_LAST_USED_KEY,
+    restore_api_key_usage,
+)
+from app.services import api_key_usage
+
+
+class TestFlushApiKeyUsage:
+    """Test cases for flush_api_key_usage."""
+
+    @pytest.mark.asyncio
+    async def test_usage_is_restored_when_database_write_fails(self):
+        """Test drained usage goes back to Redis if apply_usage raises."""
+        usage = {"key-1": (3, datetime(2026, 1, 1, tzinfo=UTC))}
+        restore = AsyncMock()
+
+        with (
+            patch.object(api_key_usage, "drain_api_key_usage", AsyncMock(return_value=usage)),
+            patch.object(api_key_usage, "restore_api_key_usage", restore),
+            patch.object(api_key_usage, "get_db_session", MagicMock()),
+            patch.object(
+                api_key_usage.api_key_crud,
+                "apply_usage",
+                AsyncMock(side_effect=TimeoutError("pool timeout")),
+            ),
+            pytest.raises(TimeoutError),
+        ):
+            await api_key_usage.flush_api_key_usage()
+
+        restore.assert_awaited_once_with(usage)
+
+    @pytest.mark.asyncio
+    async def test_restore_adds_counts_back(self):
+        """Test restored counts are added and newer timestamps are kept."""
+        last_used = datetime(2026, 1, 1, tzinfo=UTC)
+        pipe = MagicMock()
+        pipe.execute = AsyncMock(return_value=[])
+        client = MagicMock()
+        client.pipeline.return_value = pipe
+
+        with patch("app.core.cache.get_redis_client", return_value=client):
+            await restore_api_key_usage({"key-1": (3, last_used), "key-2": (1, None)})
+
+        assert pipe.hincrby.call_args_list == [
+            ((API_KEY_USAGE_COUNTS_KEY, "key-1", 3),),
+            ((API_KEY_USAGE_COUNTS_KEY, "key-2", 1),),
+        ]
+        pipe.hsetnx.assert_called_once_with(
+            API_KEY_USAGE_LAST_USED_KEY, "key-1", last_used.isoformat()
+        )
+        pipe.execute.assert_awaited_once()